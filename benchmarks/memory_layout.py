@@ -0,0 +1,34 @@
+# Memory per process: list of Process objects vs columnar ProcessTable
+# Run from the repository root: python -m benchmarks.memory_layout [n]
+
+import random
+import sys
+import tracemalloc
+
+from cpusched import Process, ProcessTable
+
+def measure(build, n):
+    tracemalloc.start()
+    data = build(n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size / n
+
+def build_objects(n):
+    rng = random.Random(0)
+    return [Process(f"P{i + 1}", rng.randint(0, n), rng.randint(1, 100), rng.randint(1, 5))
+            for i in range(n)]
+
+def build_table(n):
+    rng = random.Random(0)
+    table = ProcessTable()
+    for i in range(n):
+        table.append(rng.randint(0, n), rng.randint(1, 100), rng.randint(1, 5))
+    return table
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{'Layout':<22}{'Bytes/process':>15}")
+    print(f"{'list[Process]':<22}{measure(build_objects, n):>15.1f}")
+    print(f"{'ProcessTable':<22}{measure(build_table, n):>15.1f}")
@@ -0,0 +1,168 @@
+# Benchmark suite for the schedulers
+# Seeded synthetic workloads of several shapes and sizes; records wall time,
+# peak memory and a scaling exponent per algorithm, writes JSON, and flags
+# regressions against a baseline from an earlier run. With --instrument each
+# result also carries a Probe report (event counts, ready-queue lengths,
+# comparisons, phase times) from an extra instrumented run.
+#
+# Run from the repository root:
+#   python -m benchmarks.schedulers --max-n 100000 --output bench.json
+#   python -m benchmarks.schedulers --baseline bench.json
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from cpusched import ALGORITHMS, ProcessTable, Probe, make_scheduler, simulate
+
+QUANTUM = 4  # round_robin quantum used for every run
+SIZES = [10, 100, 1000, 10_000, 100_000, 1_000_000]
+
+# ---------- Workload shapes ----------
+# Each returns a ProcessTable of n processes drawn from rng.
+
+# Steady arrivals at about 80% load with short uniform bursts
+def uniform(n, rng):
+    table = ProcessTable()
+    for _ in range(n):
+        table.append(rng.randint(0, 13 * n), rng.randint(1, 20), rng.randint(1, 5))
+    return table
+
+# Arrivals in clumps of up to 50 processes at the same instant
+def bursty(n, rng):
+    table, t = ProcessTable(), 0
+    while len(table) < n:
+        t += rng.randint(0, 400)
+        for _ in range(min(rng.randint(1, 50), n - len(table))):
+            table.append(t, rng.randint(1, 20), rng.randint(1, 5))
+    return table
+
+# Pareto-distributed bursts: mostly short jobs with a few very long ones
+def heavy_tailed(n, rng):
+    table = ProcessTable()
+    for _ in range(n):
+        bt = min(int(rng.paretovariate(1.2)), 1_000_000)
+        table.append(rng.randint(0, 8 * n), bt, rng.randint(1, 5))
+    return table
+
+# Arrivals far apart, so the CPU is idle most of the time
+def sparse(n, rng):
+    table, t = ProcessTable(), 0
+    for _ in range(n):
+        t += rng.randint(50, 5000)
+        table.append(t, rng.randint(1, 20), rng.randint(1, 5))
+    return table
+
+SHAPES = {"uniform": uniform, "bursty": bursty, "heavy_tailed": heavy_tailed, "sparse": sparse}
+
+# ---------- Measurement ----------
+def run_once(table, algorithm, probe=None):
+    simulate(table.at, table.bt, table.priority, make_scheduler(algorithm, QUANTUM),
+             probe=probe)
+
+# Instrumented run, kept apart from the timed one
+def profile(table, algorithm):
+    probe = Probe()
+    run_once(table, algorithm, probe)
+    return probe.report()
+
+def measure(table, algorithm, memory=True):
+    t0 = time.perf_counter()
+    run_once(table, algorithm)
+    seconds = time.perf_counter() - t0
+    peak = None
+    if memory:  # separate run, tracemalloc slows the loop down
+        tracemalloc.start()
+        run_once(table, algorithm)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak
+
+# Least-squares slope of log(time) over log(n): ~1 for linear, ~2 for quadratic
+def scaling_exponent(points):
+    pts = [(math.log(n), math.log(s)) for n, s in points if s > 0]
+    if len(pts) < 2:
+        return None
+    mx = sum(x for x, _ in pts) / len(pts)
+    my = sum(y for _, y in pts) / len(pts)
+    var = sum((x - mx) ** 2 for x, _ in pts)
+    return sum((x - mx) * (y - my) for x, y in pts) / var if var else None
+
+def run_suite(sizes, shapes, algorithms, seed=0, memory=True, instrument=False, log=sys.stderr):
+    results = []
+    for shape in shapes:
+        for n in sizes:
+            table = SHAPES[shape](n, random.Random(f"{seed}-{shape}-{n}"))
+            for algorithm in algorithms:
+                seconds, peak = measure(table, algorithm, memory)
+                results.append({"shape": shape, "algorithm": algorithm, "n": n,
+                                "seconds": seconds, "peak_bytes": peak})
+                if instrument:
+                    results[-1]["probe"] = profile(table, algorithm)
+                print(f"{shape:<14}{algorithm:<22}{n:>9}{seconds:>12.4f}s", file=log)
+
+    scaling = {}
+    for shape in shapes:
+        for algorithm in algorithms:
+            points = [(r["n"], r["seconds"]) for r in results
+                      if r["shape"] == shape and r["algorithm"] == algorithm]
+            scaling[f"{shape}/{algorithm}"] = scaling_exponent(points)
+    return {
+        "meta": {"seed": seed, "quantum": QUANTUM, "python": platform.python_version(),
+                 "machine": platform.machine()},
+        "results": results,
+        "scaling": scaling,
+    }
+
+# Runs slower than the baseline by more than `tolerance` (a fraction).
+# Very short runs are ignored since their timings are mostly noise.
+def regressions(report, baseline, tolerance=0.25, min_seconds=0.005):
+    old = {(r["shape"], r["algorithm"], r["n"]): r["seconds"] for r in baseline["results"]}
+    found = []
+    for r in report["results"]:
+        before = old.get((r["shape"], r["algorithm"], r["n"]))
+        if before is None or max(before, r["seconds"]) < min_seconds:
+            continue
+        if r["seconds"] > before * (1 + tolerance):
+            found.append({**r, "baseline_seconds": before, "ratio": r["seconds"] / before})
+    return found
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the CPU schedulers")
+    parser.add_argument("--max-n", type=int, default=SIZES[-1], help="largest workload size")
+    parser.add_argument("--shape", action="append", choices=list(SHAPES),
+                        help="workload shape (repeatable, default: all)")
+    parser.add_argument("--algorithm", action="append", choices=list(ALGORITHMS),
+                        help="algorithm (repeatable, default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory runs")
+    parser.add_argument("--instrument", action="store_true",
+                        help="add a Probe report to every result")
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="earlier JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown before flagging, as a fraction")
+    args = parser.parse_args()
+
+    report = run_suite([n for n in SIZES if n <= args.max_n], args.shape or list(SHAPES),
+                       args.algorithm or list(ALGORITHMS), args.seed, not args.no_memory,
+                       args.instrument)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(report, json.load(f), args.tolerance)
+        for r in found:
+            print(f"REGRESSION {r['shape']}/{r['algorithm']} n={r['n']}: "
+                  f"{r['seconds']:.4f}s vs {r['baseline_seconds']:.4f}s ({r['ratio']:.2f}x)",
+                  file=sys.stderr)
+        sys.exit(1 if found else 0)
@@ -0,0 +1,2 @@
+# Root conftest: its presence puts the repository root on sys.path, so the
+# tests can import scheduling and schedule_gui under a plain `pytest` run
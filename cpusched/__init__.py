@@ -0,0 +1,20 @@
+# Core CPU scheduling library used by scheduling.py and schedule_gui.py
+
+from .process import Process
+from .table import ProcessTable
+from .policies import (
+    Scheduler, FCFS, SJF, SRTF, Priority, PriorityPreemptive, RoundRobin, MLFQ,
+    ALGORITHMS, QUANTUM_ALGORITHMS, make_scheduler,
+)
+from .timeline import Timeline, Rounds, expand
+from .engine import ContextSwitch, simulate, run, run_table, stream, averages
+from .multicore import MulticoreResult, simulate_multicore
+from .online import OnlineScheduler
+from .cache import ResultCache, fingerprint
+from .metrics import QuantileSketch, LatencyStats, latency_stats
+from .instrument import Probe
+from .workload import (
+    read_csv, read_jsonl, read_binary, iter_workload, load_workload, load_table, save_table,
+    convert,
+)
+from .generate import iter_processes, generate, write_trace
@@ -0,0 +1,194 @@
+# Result cache
+# Memoizes simulations by content: the key is a hash of the at/bt/priority
+# columns plus the policy class and its params() (see policy_key), so the same
+# trace run again with the same policy returns the stored WT/TAT and timeline
+# without simulating. Recent results are kept in an in-memory LRU; with a
+# `directory` they also go to disk, where other processes can read them.
+# Files are written to a temporary name and renamed into place, so readers
+# never see a partial result, and the directory is trimmed to `max_bytes` by
+# evicting the least recently used files.
+#
+#   cache = ResultCache(directory=".cpusched-cache")
+#   timeline = cache.run(processes, RoundRobin(4))
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+
+from .engine import simulate
+from .timeline import Timeline
+
+_MAGIC = b"CPSC"
+_HEADER = struct.Struct("<4sqq")  # magic, processes, timeline slices
+
+# Content hash of a workload's at/bt/priority columns (lists, arrays,
+# memoryviews or a ProcessTable's columns)
+def fingerprint(at, bt, priority):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(struct.pack("<q", len(at)))
+    for column in (at, bt, priority):
+        if isinstance(column, array) and column.typecode == "q" or \
+                isinstance(column, memoryview) and column.format == "q":
+            h.update(column)  # hashed in place, without a copy
+        else:
+            h.update(array("q", column))
+    return h.hexdigest()
+
+# The policy part of the key: the class and its params(), e.g.
+# "RoundRobin-4" or "MLFQ-2.4.8-None-None". Options that do not change the
+# schedule (round robin fast-forward and round compression) are left out.
+def policy_key(scheduler):
+    parts = [type(scheduler).__name__]
+    for p in scheduler.params():
+        parts.append(".".join(map(str, p)) if isinstance(p, tuple) else str(p))
+    return "-".join(parts)
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+class ResultCache:
+    def __init__(self, maxsize=64, directory=None, max_bytes=256 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()  # key -> (wt, tat, ids, starts, finishes)
+        self.lock = threading.Lock()
+        self.hits = self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    # Same as engine.simulate: returns (wt, tat, timeline) with the timeline
+    # holding (index, start, finish) slices. The results are fresh copies.
+    # `progress` is passed on to the simulation when there is one.
+    def simulate(self, at, bt, priority, scheduler, progress=None):
+        key = f"{fingerprint(at, bt, priority)}-{policy_key(scheduler)}"
+        entry = self.get(key)
+        if entry is None:
+            wt, tat, timeline = simulate(at, bt, priority, scheduler, progress=progress)
+            entry = (array("q", wt), array("q", tat),
+                     timeline.ids, timeline.starts, timeline.finishes)
+            self.put(key, entry)
+        wt, tat, ids, starts, finishes = (array("q", column) for column in entry)
+        timeline = Timeline()
+        timeline.ids, timeline.starts, timeline.finishes = ids, starts, finishes
+        return wt, tat, timeline
+
+    # Same as engine.run: stores WT/TAT on the processes and returns a
+    # Timeline of (pid, start, finish) slices
+    def run(self, processes, scheduler, progress=None):
+        at = [p.at for p in processes]
+        bt = [p.bt for p in processes]
+        priority = [p.priority for p in processes]
+        wt, tat, timeline = self.simulate(at, bt, priority, scheduler, progress)
+        for p, w, t in zip(processes, wt, tat):
+            p.wt, p.tat = w, t
+        timeline.labels = [p.pid for p in processes]
+        return timeline
+
+    def get(self, key):
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return entry
+        entry = self._read(key) if self.directory is not None else None
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._remember(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        with self.lock:
+            self._remember(key, entry)
+        if self.directory is not None:
+            self._write(key, entry)
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".bin"):
+                    _remove(os.path.join(self.directory, name))
+
+    def _remember(self, key, entry):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.maxsize:
+            self.memory.popitem(last=False)
+
+    # ---- disk tier ----
+    # One file per key: header, then the wt, tat, ids, starts and finishes
+    # columns as raw 8-byte integers in native byte order (the cache is
+    # meant for one machine).
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".bin")
+
+    def _read(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, n, m = _HEADER.unpack_from(data)
+        if magic != _MAGIC or len(data) != _HEADER.size + 8 * (2 * n + 3 * m):
+            _remove(path)  # damaged; recompute
+            return None
+        entry, offset = [], _HEADER.size
+        for size in (n, n, m, m, m):
+            column = array("q")
+            column.frombytes(data[offset:offset + 8 * size])
+            entry.append(column)
+            offset += 8 * size
+        return tuple(entry)
+
+    def _write(self, key, entry):
+        wt, tat, ids, starts, finishes = entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, len(wt), len(ids)))
+                for column in entry:
+                    f.write(column.tobytes())
+            os.replace(tmp, self._path(key))
+        except OSError:
+            _remove(tmp)
+            return
+        self._evict()
+
+    # Delete the least recently used files until the directory fits in
+    # max_bytes. Files removed concurrently by another process are skipped.
+    def _evict(self):
+        files, total = [], 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".bin"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= size
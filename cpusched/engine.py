@@ -0,0 +1,249 @@
+# Simulation loop shared by every policy
+# Time jumps from event to event (arrival, slice end, completion), so the cost
+# is O((n + slices) log n) no matter how long the bursts are.
+
+import importlib.util
+
+from .policies import FCFS
+from .timeline import Rounds, Timeline
+
+# Context-switch model, passed to simulate()/run() as `overhead`. Every time
+# the CPU dispatches a process other than the one it last ran (including the
+# first dispatch and after an idle gap) it spends `cost` time units switching,
+# and the incoming process then spends `warmup` units refilling its cold cache
+# before making progress (shown as part of its slice). Neither counts toward
+# the quantum. The engine fills in the counters below during the run.
+class ContextSwitch:
+    def __init__(self, cost=0, warmup=0):
+        self.cost, self.warmup = cost, warmup
+        self.switches = 0  # number of context switches
+        self.overhead = 0  # time spent on switches and warmup
+        self.busy = 0      # CPU time used, overhead included
+        self.start = self.finish = 0  # first arrival, last completion
+
+    # Share of the elapsed time the CPU spent on useful work
+    @property
+    def utilization(self):
+        span = self.finish - self.start
+        return (self.busy - self.overhead) / span if span else 0.0
+
+# The event loop. `arrivals` yields process indices in arrival order; at/bt
+# are indexable columns (lists, or dicts filled in as arrivals are read).
+# Yields (index, finish time) as processes complete and appends
+# (index, start, finish) slices to `timeline` unless it is None, exactly as
+# they run; joining contiguous slices is left to the timeline. Switch costs
+# are charged and counted when a ContextSwitch is passed as `overhead`.
+# With a dict as `first`, the first dispatch time of each process is stored
+# under its index (the caller removes entries once they are used).
+def _events(arrivals, at, bt, scheduler, timeline, overhead=None, first=None):
+    arrivals = iter(arrivals)
+    remaining = {}  # only processes that have arrived and not finished
+    push, pop = scheduler.push, scheduler.pop
+    preemptive, quantum = scheduler.preemptive, scheduler.quantum
+    fast_forward, compress = scheduler.fast_forward, scheduler.compress_rounds
+    dynamic = scheduler.dynamic
+    if overhead is not None:
+        cost, warmup = overhead.cost, overhead.warmup
+        if cost or warmup:  # every slice of a round would pay a switch
+            fast_forward = False
+    record = timeline is not None
+    skip = 0  # slices left before the next fast-forward check
+    time, nxt = 0, next(arrivals, None)
+    loaded = None  # process whose context is on the CPU
+    if overhead is not None and nxt is not None:
+        overhead.start = at[nxt]
+
+    while True:
+        # Move every process that has arrived into the ready queue
+        while nxt is not None and at[nxt] <= time:
+            remaining[nxt] = bt[nxt]
+            push(nxt, bt[nxt])
+            nxt = next(arrivals, None)
+        if not len(scheduler):
+            if nxt is None:
+                break
+            time = at[nxt]  # CPU idle, jump to the next arrival
+            continue
+
+        # Quantum policies: while no process can finish and nothing arrives,
+        # each round just rotates the queue back to the same order, so whole
+        # rounds are applied at once. Checked at most once per round.
+        if fast_forward:
+            if skip:
+                skip -= 1
+            else:
+                queue = scheduler.queued()
+                k = len(queue)
+                skip = k
+                rounds = (min(remaining[i] for i in queue) - 1) // quantum
+                if nxt is not None:
+                    rounds = min(rounds, (at[nxt] - time - 1) // (k * quantum))
+                if rounds > 0:
+                    if first is not None:
+                        for pos, i in enumerate(queue):
+                            if i not in first:
+                                first[i] = time + pos * quantum
+                    if record:
+                        if k == 1:  # a lone process: one slice covers every round
+                            timeline.append((queue[0], time, time + rounds * quantum))
+                        elif compress:
+                            timeline.append(Rounds(tuple(queue), time, quantum, rounds))
+                        else:
+                            timeline.extend(Rounds(queue, time, quantum, rounds).slices())
+                    for i in queue:
+                        remaining[i] -= rounds * quantum
+                    time += rounds * k * quantum
+                    if overhead is not None:  # only reached when switches are free
+                        overhead.switches += (rounds * k - 1 if k > 1 else 0) + (queue[0] != loaded)
+                        overhead.busy += rounds * k * quantum
+                        loaded = queue[-1]
+
+        if dynamic:
+            scheduler.at_time(time)
+        idx = pop()
+        if dynamic:
+            quantum = scheduler.quantum
+        start = time
+        if overhead is not None and idx != loaded:  # context switch
+            loaded = idx
+            overhead.switches += 1
+            overhead.overhead += cost + warmup
+            overhead.busy += cost + warmup
+            start = time + cost
+            time = start + warmup  # the slice begins with the cache warming up
+        if first is not None and idx not in first:
+            first[idx] = start
+        run = remaining[idx]
+        if quantum is not None and run > quantum:
+            run = quantum
+        if preemptive and nxt is not None:  # the next arrival may preempt it
+            run = max(0, min(run, at[nxt] - time))
+        time += run
+        left = remaining[idx] - run
+        if overhead is not None:
+            overhead.busy += run
+
+        if record:
+            timeline.append((idx, start, time))
+
+        if left == 0:  # process completed
+            del remaining[idx]
+            if dynamic:
+                scheduler.done(idx)
+            yield idx, time
+        else:
+            remaining[idx] = left
+            # Arrivals during the slice queue up ahead of the preempted process
+            while nxt is not None and at[nxt] <= time:
+                remaining[nxt] = bt[nxt]
+                push(nxt, bt[nxt])
+                nxt = next(arrivals, None)
+            push(idx, left)
+
+    if overhead is not None:
+        overhead.finish = time
+
+# Run a policy over workload columns. Returns (wt, tat, timeline) where the
+# timeline holds (index, start, finish) slices: a Timeline unless another
+# container (e.g. a list, to keep every slice and Rounds record) is passed,
+# or nothing is recorded when timeline is False.
+# WT/TAT are written into the given wt/tat columns, otherwise into new lists.
+# Pass a ContextSwitch as `overhead` to charge and report switch costs.
+# `progress(done, n)` is called after every completion; an exception raised
+# from it aborts the run. A Probe passed as `probe` instruments the run.
+# `order` gives the indices in arrival order when the caller already knows
+# it (e.g. range(n) for a trace stored by arrival), which saves the sort.
+def simulate(at, bt, priority, scheduler, wt=None, tat=None, timeline=None, overhead=None,
+             progress=None, probe=None, order=None):
+    n = len(at)
+    if wt is None:
+        wt = [0] * n
+    if tat is None:
+        tat = [0] * n
+    if timeline is None:
+        timeline = Timeline()
+    elif timeline is False:
+        timeline = None
+    recorder = timeline
+    if probe is not None:
+        scheduler, recorder = probe.attach(scheduler, timeline)
+    scheduler.reset(at, bt, priority)
+    arrivals = order if order is not None else sorted(range(n), key=at.__getitem__)
+    events = _events(arrivals, at, bt, scheduler, recorder, overhead)
+    if probe is not None:
+        events = probe.events(events)
+    done = 0
+    for i, finish in events:
+        tat[i] = finish - at[i]
+        wt[i] = tat[i] - bt[i]
+        if progress is not None:
+            done += 1
+            progress(done, n)
+    return wt, tat, timeline
+
+# Run a policy over Process objects, storing WT/TAT on them.
+# Returns a Timeline of (pid, start, finish) slices.
+def run(processes, scheduler, overhead=None, progress=None, probe=None):
+    at = [p.at for p in processes]
+    bt = [p.bt for p in processes]
+    priority = [p.priority for p in processes]
+    wt, tat, timeline = simulate(at, bt, priority, scheduler, overhead=overhead,
+                                 progress=progress, probe=probe)
+    for p, w, t in zip(processes, wt, tat):
+        p.wt, p.tat = w, t
+    timeline.labels = [p.pid for p in processes]
+    return timeline
+
+# Run a policy over a ProcessTable, storing WT/TAT in its columns.
+# Returns a Timeline of (pid, start, finish) slices. Plain FCFS runs on the
+# NumPy backend in vectorized.py when NumPy is installed.
+def run_table(table, scheduler, overhead=None, probe=None):
+    if (type(scheduler) is FCFS and overhead is None and probe is None and len(table)
+            and importlib.util.find_spec("numpy") is not None):
+        from .vectorized import run_fcfs_table
+        return run_fcfs_table(table)
+    order = range(len(table)) if table.by_arrival else None
+    wt, tat, timeline = simulate(table.at, table.bt, table.priority, scheduler,
+                                 table.wt, table.tat, overhead=overhead, probe=probe,
+                                 order=order)
+    timeline.labels = table.pid
+    return timeline
+
+# Run a policy over an iterable of Process objects sorted by arrival time,
+# e.g. straight from iter_workload(). Only processes that have arrived and not
+# finished are kept, and each one is yielded with WT/TAT set as it completes.
+# Pass a list as `timeline` to collect (arrival number, start, finish) slices
+# and a LatencyStats as `stats` to add every completion (with its response
+# time) to it. A Probe passed as `probe` instruments the run.
+def stream(processes, scheduler, timeline=None, stats=None, probe=None):
+    at, bt, priority, active = {}, {}, {}, {}
+    first = {} if stats is not None else None
+    if probe is not None:
+        scheduler, timeline = probe.attach(scheduler, timeline)
+    scheduler.reset(at, bt, priority)
+
+    def arrivals():
+        last_at = None
+        for i, p in enumerate(processes):
+            if last_at is not None and p.at < last_at:
+                raise ValueError(f"workload is not sorted by arrival time at {p.pid}")
+            last_at = p.at
+            at[i], bt[i], priority[i], active[i] = p.at, p.bt, p.priority, p
+            yield i
+
+    events = _events(arrivals(), at, bt, scheduler, timeline, first=first)
+    if probe is not None:
+        events = probe.events(events)
+    for i, finish in events:
+        p = active.pop(i)
+        del at[i], bt[i], priority[i]
+        p.tat = finish - p.at
+        p.wt = p.tat - p.bt
+        if stats is not None:
+            stats.add(p.wt, p.tat, first.pop(i) - p.at, p.bt)
+        yield p
+
+# Average waiting and turnaround time
+def averages(processes):
+    n = len(processes)
+    return sum(p.wt for p in processes) / n, sum(p.tat for p in processes) / n
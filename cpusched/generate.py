@@ -0,0 +1,231 @@
+# Synthetic workload generator
+# Seeded traces with statistical arrival and burst models, produced in
+# column chunks so millions of jobs go straight to a file or the engine:
+#
+#   arrivals  "poisson": exponential gaps at a fixed rate
+#             "mmpp":    two-state Markov-modulated Poisson process; the rate
+#                        switches between a busy and a quiet phase
+#                        (`burstiness` times apart, a phase lasts `dwell`
+#                        arrivals on average)
+#   bursts    "pareto" (tail index `shape` > 1), "lognormal" (log-sd `sigma`)
+#             or "exponential", all with mean `mean_burst`, rounded up to
+#             whole time units and optionally capped at `max_burst`
+#   priority  1..`priorities`; with probability `correlation` a job's
+#             priority follows its burst quantile (long jobs get high numbers,
+#             i.e. low priority), otherwise it is drawn uniformly
+#   load      arrival rates are set so that the offered load (mean burst /
+#             mean gap) is `utilization`
+#
+# NumPy is used when it is installed (each chunk is a few array operations);
+# otherwise the same models run in pure Python. A seed gives the same trace
+# every time on the same backend.
+#
+#   python scheduling.py --generate 1000000 --arrivals mmpp --seed 1 --save trace.cpt
+
+import importlib.util
+import math
+import random
+
+from .process import Process
+from .table import ProcessTable
+from .workload import is_binary, open_text, write_binary
+
+ARRIVALS = ("poisson", "mmpp")
+BURSTS = ("pareto", "lognormal", "exponential")
+CHUNK = 1 << 16
+
+# Rates (arrivals per time unit) of each MMPP phase; the phases are equally
+# likely, so the mean gap is the average of 1 / rate over the two
+def _mmpp_rates(rate, burstiness):
+    quiet = 0.5 * rate * (1 + 1 / burstiness)
+    return quiet * burstiness, quiet
+
+def _check(arrivals, bursts, utilization, mean_burst, shape, sigma, burstiness, dwell,
+           priorities, correlation, max_burst):
+    if arrivals not in ARRIVALS:
+        raise ValueError(f"unknown arrival model: {arrivals}")
+    if bursts not in BURSTS:
+        raise ValueError(f"unknown burst model: {bursts}")
+    if utilization <= 0 or mean_burst <= 0 or priorities < 1:
+        raise ValueError("utilization, mean_burst and priorities must be positive")
+    if bursts == "pareto" and shape <= 1:
+        raise ValueError("the pareto shape must be above 1 for a finite mean")
+    if bursts == "lognormal" and sigma <= 0:
+        raise ValueError("the lognormal sigma must be positive")
+    if arrivals == "mmpp" and burstiness <= 0:
+        raise ValueError("burstiness must be positive")
+    if arrivals == "mmpp" and dwell < 1:
+        raise ValueError("dwell must be at least 1 arrival")
+    if max_burst is not None and max_burst < 1:
+        raise ValueError("max_burst must be at least 1")
+    if not 0 <= correlation <= 1:
+        raise ValueError("correlation must be between 0 and 1")
+
+# Iterator of (at, bt, priority) column chunks of up to `chunk` jobs, sorted
+# by arrival time: NumPy int64 arrays with NumPy, lists without. The
+# parameters are checked (ValueError) by the call itself, before any chunk.
+def iter_columns(n, seed=None, arrivals="poisson", bursts="pareto", utilization=0.8,
+                 mean_burst=10, shape=1.5, sigma=1.0, burstiness=10, dwell=100,
+                 priorities=5, correlation=0.5, max_burst=None, chunk=CHUNK):
+    _check(arrivals, bursts, utilization, mean_burst, shape, sigma, burstiness, dwell,
+           priorities, correlation, max_burst)
+    rate = utilization / mean_burst
+    if arrivals == "mmpp":
+        busy, quiet = _mmpp_rates(rate, burstiness)
+        switch = 1 / dwell
+    else:
+        busy = quiet = rate
+        switch = 0
+    # rounding up adds about half a unit, so aim the continuous draw lower
+    base = mean_burst - 0.5 if mean_burst > 1 else mean_burst
+    xm = base * (shape - 1) / shape  # pareto scale
+    mu = math.log(base) - sigma * sigma / 2  # lognormal location
+    # NumPy is only imported by _numpy_chunks, so importing cpusched stays cheap
+    gen = _numpy_chunks if importlib.util.find_spec("numpy") is not None else _python_chunks
+    return gen(n, seed, arrivals, bursts, rate, busy, quiet, switch, xm, shape,
+               mu, sigma, base, priorities, correlation, max_burst, chunk)
+
+def _numpy_chunks(n, seed, arrivals, bursts, rate, busy, quiet, switch, xm, shape,
+                  mu, sigma, mean_burst, priorities, correlation, max_burst, chunk):
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    clock, phase = 0.0, 0
+    for lo in range(0, n, chunk):
+        m = min(chunk, n - lo)
+        # arrivals
+        gaps = rng.standard_exponential(m)
+        if arrivals == "mmpp":
+            phases = (phase + np.cumsum(rng.random(m) < switch)) % 2
+            phase = int(phases[-1])
+            gaps /= np.where(phases == 0, busy, quiet)
+        else:
+            gaps /= rate
+        times = clock + np.cumsum(gaps)
+        clock = float(times[-1])
+        at = np.floor(times).astype(np.int64)
+        # bursts by inverse CDF of u, which also drives the priority
+        u = rng.random(m)
+        if bursts == "pareto":
+            bt = xm * (1 - u) ** (-1 / shape)
+        elif bursts == "lognormal":
+            bt = np.exp(mu + sigma * rng.standard_normal(m))
+            u = np.argsort(np.argsort(bt)) / m  # burst quantile within the chunk
+        else:
+            bt = -mean_burst * np.log1p(-u)
+        bt = np.maximum(np.ceil(bt), 1)
+        if max_burst is not None:
+            bt = np.minimum(bt, max_burst)
+        bt = bt.astype(np.int64)
+        # priorities
+        v = np.where(rng.random(m) < correlation, u, rng.random(m))
+        priority = np.minimum((v * priorities).astype(np.int64), priorities - 1) + 1
+        yield at, bt, priority
+
+def _python_chunks(n, seed, arrivals, bursts, rate, busy, quiet, switch, xm, shape,
+                   mu, sigma, mean_burst, priorities, correlation, max_burst, chunk):
+    rng = random.Random(seed)
+    clock, phase = 0.0, 0
+    for lo in range(0, n, chunk):
+        at, bt, priority = [], [], []
+        for _ in range(min(chunk, n - lo)):
+            if arrivals == "mmpp":
+                if rng.random() < switch:
+                    phase = 1 - phase
+                clock += rng.expovariate(busy if phase == 0 else quiet)
+            else:
+                clock += rng.expovariate(rate)
+            u = rng.random()
+            if bursts == "pareto":
+                b = xm * (1 - u) ** (-1 / shape)
+            elif bursts == "lognormal":
+                # normal quantile by the lognormal's own CDF
+                b = math.exp(mu + sigma * rng.gauss(0, 1))
+                u = 0.5 * (1 + math.erf((math.log(b) - mu) / (sigma * math.sqrt(2))))
+            else:
+                b = -mean_burst * math.log1p(-u)
+            b = max(math.ceil(b), 1)
+            if max_burst is not None:
+                b = min(b, max_burst)
+            v = u if rng.random() < correlation else rng.random()
+            at.append(int(clock))
+            bt.append(b)
+            priority.append(min(int(v * priorities), priorities - 1) + 1)
+        yield at, bt, priority
+
+# iter_columns() with every chunk as lists, whichever backend made it
+def _list_columns(chunks):
+    for at, bt, priority in chunks:
+        if not isinstance(at, list):  # NumPy chunk
+            at, bt, priority = at.tolist(), bt.tolist(), priority.tolist()
+        yield at, bt, priority
+
+# Generated jobs as Process objects named P1, P2, ..., made lazily (for
+# stream() and the CLI); the parameters are checked by the call
+def iter_processes(n, **params):
+    return _processes(iter_columns(n, **params))
+
+def _processes(chunks):
+    k = 0
+    for at, bt, priority in _list_columns(chunks):
+        for a, b, p in zip(at, bt, priority):
+            k += 1
+            yield Process(f"P{k}", a, b, p)
+
+# A whole generated workload as a ProcessTable
+def generate(n, **params):
+    table = ProcessTable()
+    for at, bt, priority in _list_columns(iter_columns(n, **params)):
+        table.at.extend(at)
+        table.bt.extend(bt)
+        table.priority.extend(priority)
+    table.wt.extend([0] * len(table.at))
+    table.tat.extend([0] * len(table.at))
+    return table
+
+# Write a generated trace chunk by chunk: a binary trace for ".cpt", JSON
+# Lines for ".jsonl"/".ndjson", CSV otherwise, gzip-compressed for ".gz"
+def write_trace(path, n, **params):
+    if is_binary(path):
+        write_binary(path, n, iter_columns(n, **params), ordered=True)
+        return
+    name = str(path)
+    jsonl = name.removesuffix(".gz").endswith((".jsonl", ".ndjson"))
+    chunks = _list_columns(iter_columns(n, **params))  # checked before the file is created
+    with open_text(path, "w") as f:
+        if not jsonl:
+            f.write("pid,at,bt,priority\n")
+        k = 0
+        for at, bt, priority in chunks:
+            if jsonl:
+                lines = [f'{{"pid": "P{k + j + 1}", "at": {a}, "bt": {b}, "priority": {p}}}'
+                         for j, (a, b, p) in enumerate(zip(at, bt, priority))]
+            else:
+                lines = [f"P{k + j + 1},{a},{b},{p}"
+                         for j, (a, b, p) in enumerate(zip(at, bt, priority))]
+            f.write("\n".join(lines) + "\n")
+            k += len(at)
+
+# Command-line options shared with the scheduling CLI
+def add_arguments(parser):
+    parser.add_argument("--seed", type=int, help="random seed (default: fresh)")
+    parser.add_argument("--arrivals", choices=ARRIVALS, default="poisson")
+    parser.add_argument("--bursts", choices=BURSTS, default="pareto")
+    parser.add_argument("--utilization", type=float, default=0.8, help="offered load")
+    parser.add_argument("--mean-burst", type=float, default=10)
+    parser.add_argument("--shape", type=float, default=1.5, help="pareto tail index")
+    parser.add_argument("--sigma", type=float, default=1.0, help="lognormal log-sd")
+    parser.add_argument("--burstiness", type=float, default=10,
+                        help="mmpp busy/quiet rate ratio")
+    parser.add_argument("--dwell", type=float, default=100,
+                        help="mmpp mean arrivals per phase")
+    parser.add_argument("--priorities", type=int, default=5, help="number of priority levels")
+    parser.add_argument("--correlation", type=float, default=0.5,
+                        help="share of priorities that follow burst length")
+    parser.add_argument("--max-burst", type=int, help="cap on burst length")
+
+def params_from(args):
+    return {"seed": args.seed, "arrivals": args.arrivals, "bursts": args.bursts,
+            "utilization": args.utilization, "mean_burst": args.mean_burst,
+            "shape": args.shape, "sigma": args.sigma, "burstiness": args.burstiness,
+            "dwell": args.dwell, "priorities": args.priorities,
+            "correlation": args.correlation, "max_burst": args.max_burst}
@@ -0,0 +1,169 @@
+# Instrumentation
+# A Probe, passed to simulate()/run()/run_table()/stream() as `probe`,
+# wraps the policy and the timeline for that one run and records:
+#   - event counts: arrivals, requeues, dispatches, completions, slices
+#   - a histogram of the ready-queue length at each dispatch
+#   - key comparisons made by heap-based policies (those using Scheduler.key)
+#   - time spent queueing (push), selecting (pop), recording slices and in
+#     the rest of the loop, plus any phases timed with probe.phase(name)
+# Everything is wired up once before the run, so without a probe the loop is
+# exactly the uninstrumented one. The report is plain JSON, or a pstats file
+# that `python -m pstats`, snakeviz and friends can open.
+#
+#   probe = Probe()
+#   run(processes, SRTF(), probe=probe)
+#   with probe.phase("print"):
+#       print_table(...)
+#   probe.write_json("run.json"); probe.dump_stats("run.prof")
+
+import copy
+import json
+import marshal
+import time
+from contextlib import contextmanager
+
+# Heap key wrapper that counts the comparisons made on it
+class _Counted:
+    __slots__ = ("key", "probe")
+
+    def __init__(self, key, probe):
+        self.key, self.probe = key, probe
+
+    def __lt__(self, other):
+        self.probe.comparisons += 1
+        return self.key < other.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+# Stands in for the policy during an instrumented run; anything not timed
+# here (flags, quantum, queued, at_time, ...) is read from the policy itself
+class _ProbedScheduler:
+    def __init__(self, scheduler, probe):
+        # a copy, so counting keys never leak into the caller's policy
+        self._inner = inner = copy.copy(scheduler)
+        self._probe = probe
+        self._seen = set()
+        key = inner.key
+        inner.key = lambda i, remaining: _Counted(key(i, remaining), probe)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+    def __len__(self):
+        return len(self._inner)
+
+    def push(self, i, remaining):
+        probe = self._probe
+        if i in self._seen:
+            probe.count("requeues")
+        else:
+            self._seen.add(i)
+            probe.count("arrivals")
+        t0 = time.perf_counter()
+        self._inner.push(i, remaining)
+        probe.add_time("push", time.perf_counter() - t0)
+
+    def pop(self):
+        probe = self._probe
+        probe.count("dispatches")
+        probe.queue_length(len(self._inner))
+        t0 = time.perf_counter()
+        i = self._inner.pop()
+        probe.add_time("pop", time.perf_counter() - t0)
+        return i
+
+class _ProbedTimeline:
+    def __init__(self, timeline, probe):
+        self._inner, self._probe = timeline, probe
+
+    def append(self, rec):
+        t0 = time.perf_counter()
+        self._inner.append(rec)
+        self._probe.add_time("record", time.perf_counter() - t0)
+        self._probe.count("slices")
+
+    def extend(self, recs):
+        for rec in recs:
+            self.append(rec)
+
+class Probe:
+    def __init__(self):
+        self.counts = {}
+        self.times = {}   # phase -> seconds
+        self.calls = {}   # phase -> times entered
+        self.queue_lengths = {}  # power-of-two bucket -> dispatches
+        self.comparisons = 0
+
+    def count(self, event, k=1):
+        self.counts[event] = self.counts.get(event, 0) + k
+
+    def add_time(self, phase, seconds):
+        self.times[phase] = self.times.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    # Ready-queue lengths are bucketed as 0, 1, 2-3, 4-7, ...
+    def queue_length(self, n):
+        b = n.bit_length()
+        self.queue_lengths[b] = self.queue_lengths.get(b, 0) + 1
+
+    @contextmanager
+    def phase(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - t0)
+
+    # Used by the engine: instrumented stand-ins for one run's policy and
+    # timeline (None stays None)
+    def attach(self, scheduler, timeline):
+        return (_ProbedScheduler(scheduler, self),
+                None if timeline is None else _ProbedTimeline(timeline, self))
+
+    # Used by the engine around the event loop: counts completions and splits
+    # the loop's own time (not the caller's, between completions) into the
+    # phases above and "loop" for everything else
+    def events(self, events):
+        phases = ("push", "pop", "record")
+        before = sum(self.times.get(p, 0.0) for p in phases)
+        events, total = iter(events), 0.0
+        try:
+            while True:
+                t0 = time.perf_counter()
+                try:
+                    event = next(events)
+                finally:
+                    total += time.perf_counter() - t0
+                self.count("completions")
+                yield event
+        except StopIteration:
+            pass
+        finally:
+            inner = sum(self.times.get(p, 0.0) for p in phases) - before
+            self.add_time("loop", total - inner)
+
+    def report(self):
+        buckets = {}
+        for b in sorted(self.queue_lengths):
+            label = str(b) if b < 2 else f"{1 << (b - 1)}-{(1 << b) - 1}"
+            buckets[label] = self.queue_lengths[b]
+        return {
+            "counts": dict(self.counts),
+            "comparisons": self.comparisons,
+            "ready_queue_lengths": buckets,
+            "phases": {p: {"seconds": self.times[p], "calls": self.calls[p]} for p in self.times},
+        }
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+    # pstats format: a marshalled {(file, line, name): (primitive calls,
+    # calls, own time, cumulative time, callers)}, one entry per phase
+    def dump_stats(self, path):
+        stats = {("cpusched", 0, phase): (self.calls[phase], self.calls[phase],
+                                          self.times[phase], self.times[phase], {})
+                 for phase in self.times}
+        with open(path, "wb") as f:
+            marshal.dump(stats, f)
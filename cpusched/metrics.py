@@ -0,0 +1,169 @@
+# Latency distributions
+# Tail percentiles of waiting time, response time (first dispatch minus
+# arrival) and slowdown (turnaround / burst) kept in bounded memory, so they
+# can be collected in the same pass as a streamed simulation:
+#
+#   stats = LatencyStats()
+#   for p in stream(iter_workload(path), RoundRobin(4), stats=stats):
+#       pass
+#   stats.summary()["wt"]["p99"]
+
+import math
+
+# Quantile sketch with relative error `accuracy` (log-spaced buckets, as in
+# DDSketch): a reported quantile is within accuracy * value of a true sample
+# at that rank. Memory grows with log(max / min), not with the sample count.
+class QuantileSketch:
+    def __init__(self, accuracy=0.01):
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}  # bucket index -> count, for positive values
+        self.zeros = 0     # zero and negative values
+        self.count = 0
+        self.max = None
+
+    def add(self, x):
+        self.count += 1
+        if self.max is None or x > self.max:
+            self.max = x
+        if x <= 0:
+            self.zeros += 1
+        else:
+            k = math.ceil(math.log(x) / self.log_gamma)
+            self.buckets[k] = self.buckets.get(k, 0) + 1
+
+    # Fold another sketch with the same accuracy into this one
+    def merge(self, other):
+        if other.accuracy != self.accuracy:
+            raise ValueError("cannot merge sketches with different accuracy")
+        for k, c in other.buckets.items():
+            self.buckets[k] = self.buckets.get(k, 0) + c
+        self.zeros += other.zeros
+        self.count += other.count
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        if q >= 1:
+            return self.max
+        rank = max(0, math.ceil(q * self.count) - 1)  # nearest-rank definition
+        seen = self.zeros
+        if rank < seen:
+            return 0
+        for k in sorted(self.buckets):
+            seen += self.buckets[k]
+            if rank < seen:
+                # midpoint of the bucket (gamma^(k-1), gamma^k], capped at max
+                return min(2 * self.gamma ** k / (self.gamma + 1), self.max)
+        return self.max
+
+# Every sample kept, for exact nearest-rank quantiles when the values are in
+# memory anyway. Same interface as QuantileSketch.
+class Samples:
+    def __init__(self):
+        self.values = []
+        self.max = None
+
+    @property
+    def count(self):
+        return len(self.values)
+
+    def add(self, x):
+        self.values.append(x)
+        if self.max is None or x > self.max:
+            self.max = x
+
+    def merge(self, other):
+        if not isinstance(other, Samples):
+            raise ValueError("cannot merge samples with a sketch")
+        for x in other.values:
+            self.add(x)
+
+    def quantile(self, q):
+        values = self.values
+        if not values:
+            return None
+        values.sort()
+        rank = max(0, math.ceil(q * len(values)) - 1)  # nearest-rank definition
+        return values[min(rank, len(values) - 1)]
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+# Waiting, turnaround, response and slowdown distributions of completed
+# processes. Averages and maxima are exact; percentiles come from sketches,
+# or from every sample when `exact` is set.
+class LatencyStats:
+    def __init__(self, accuracy=0.01, exact=False):
+        self.n = 0
+        self.total_wt = self.total_tat = self.total_response = 0
+        self.total_slowdown = 0.0
+        self.wt, self.response, self.slowdown = (
+            Samples() if exact else QuantileSketch(accuracy) for _ in range(3))
+
+    # One completed process; response is None when it was not tracked
+    def add(self, wt, tat, response, bt):
+        self.n += 1
+        self.total_wt += wt
+        self.total_tat += tat
+        self.wt.add(wt)
+        if response is not None:
+            self.total_response += response
+            self.response.add(response)
+        slowdown = tat / bt if bt else 1.0
+        self.total_slowdown += slowdown
+        self.slowdown.add(slowdown)
+
+    def merge(self, other):
+        self.n += other.n
+        self.total_wt += other.total_wt
+        self.total_tat += other.total_tat
+        self.total_response += other.total_response
+        self.total_slowdown += other.total_slowdown
+        self.wt.merge(other.wt)
+        self.response.merge(other.response)
+        self.slowdown.merge(other.slowdown)
+
+    # {"n", "avg_wt", "avg_tat", and for wt/response/slowdown a dict with
+    # avg, p50, p95, p99 and max}
+    def summary(self):
+        out = {"n": self.n,
+               "avg_wt": self.total_wt / self.n if self.n else 0.0,
+               "avg_tat": self.total_tat / self.n if self.n else 0.0}
+        for name, sketch, total in (("wt", self.wt, self.total_wt),
+                                    ("response", self.response, self.total_response),
+                                    ("slowdown", self.slowdown, self.total_slowdown)):
+            row = {"avg": total / sketch.count if sketch.count else None}
+            for q in PERCENTILES:
+                row[f"p{round(q * 100)}"] = sketch.quantile(q)
+            row["max"] = sketch.max
+            out[name] = row
+        return out
+
+    # Text lines for the CLI and GUI reports
+    def format(self):
+        s = self.summary()
+        lines = [f"{'':<14}{'avg':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"]
+        for name, label in (("wt", "Waiting"), ("response", "Response"), ("slowdown", "Slowdown")):
+            row = s[name]
+            cells = [row["avg"], row["p50"], row["p95"], row["p99"], row["max"]]
+            lines.append(f"{label:<14}" + "".join(
+                f"{'-':>10}" if v is None else f"{v:>10.2f}" for v in cells))
+        return lines
+
+# Stats for processes that already have WT/TAT set, taking response times
+# from the first slice of each process in their timeline. Every process is in
+# memory already, so the percentiles are exact (`accuracy` no longer has an
+# effect).
+def latency_stats(processes, timeline, accuracy=0.01):
+    first = {}
+    for i, start in zip(timeline.ids, timeline.starts):
+        if i not in first:
+            first[i] = start
+    stats = LatencyStats(accuracy, exact=True)
+    for i, p in enumerate(processes):
+        response = first[i] - p.at if i in first else 0  # zero burst: never dispatched
+        stats.add(p.wt, p.tat, response, p.bt)
+    return stats
@@ -0,0 +1,217 @@
+# Multi-CPU simulation
+# The same policies on m CPUs, either sharing one global ready queue or with a
+# ready queue per CPU plus work stealing. Like the single-CPU engine it jumps
+# between events (arrivals and slice ends, kept in a heap), so the cost is
+# O((n + events) log n) for any m.
+#
+# Global queue: idle CPUs take the next process from the shared queue, lowest
+# CPU number first. For preemptive policies an arrival that beats the worst
+# running process takes over that process's CPU.
+#
+# Per-CPU queues: arrivals are spread over the CPUs in turn. A CPU only picks
+# from (and is only preempted by) its own queue; once both its queue and its
+# slice are done it steals the next process from the longest queue.
+
+import copy
+import heapq
+
+from .timeline import Timeline
+
+class MulticoreResult:
+    def __init__(self, wt, tat, timelines, busy, start, finish):
+        self.wt, self.tat = wt, tat
+        self.timelines = timelines  # one Timeline per CPU
+        self.busy = busy            # busy time per CPU
+        self.start, self.finish = start, finish
+
+    @property
+    def makespan(self):
+        return self.finish - self.start
+
+    # Fraction of the available CPU time (m * makespan) spent running processes
+    @property
+    def utilization(self):
+        span = self.makespan * len(self.busy)
+        return sum(self.busy) / span if span else 0.0
+
+# Max-heap entry: orders the running processes worst first
+class _Worst:
+    __slots__ = ("key", "cpu", "token")
+
+    def __init__(self, key, cpu, token):
+        self.key, self.cpu, self.token = key, cpu, token
+
+    def __lt__(self, other):
+        return self.key > other.key
+
+def simulate_multicore(at, bt, priority, scheduler, cpus, per_cpu=False):
+    if cpus < 1:
+        raise ValueError("cpus must be at least 1")
+    if scheduler.dynamic:
+        raise ValueError(f"{scheduler.name} is not supported on multiple CPUs")
+    n = len(at)
+    arrivals = sorted(range(n), key=at.__getitem__)
+    remaining = list(bt)
+    wt, tat = [0] * n, [0] * n
+    quantum, preemptive = scheduler.quantum, scheduler.preemptive
+
+    queues = [copy.copy(scheduler) for _ in range(cpus if per_cpu else 1)]
+    for q in queues:
+        q.reset(at, bt, priority)
+    longest = []  # per_cpu: lazy max-heap of (-queue length, cpu)
+
+    running = [None] * cpus        # process index on each CPU
+    slice_start = [0] * cpus
+    finish_at = [0] * cpus         # when the running process would complete
+    token = [0] * cpus             # bumped on every dispatch; stale events are skipped
+    events = []                    # heap of (slice end, cpu, token)
+    worst = []                     # global preemptive: heap of _Worst over running CPUs
+    idle = list(range(cpus))       # heap of idle CPUs (per_cpu: may hold busy ones)
+    timelines = [Timeline() for _ in range(cpus)]
+    busy = [0] * cpus
+    time, nxt, completed, placed = 0, 0, 0, 0
+
+    def queue_of(c):
+        return queues[c] if per_cpu else queues[0]
+
+    def enqueue(c, i):
+        q = queue_of(c)
+        q.push(i, remaining[i])
+        if per_cpu:
+            heapq.heappush(longest, (-len(q), c))
+
+    def dispatch(c, i):
+        running[c] = i
+        slice_start[c] = time
+        finish_at[c] = time + remaining[i]
+        end = time + remaining[i] if quantum is None else time + min(remaining[i], quantum)
+        token[c] += 1
+        heapq.heappush(events, (end, c, token[c]))
+        if preemptive and not per_cpu:
+            heapq.heappush(worst, _Worst((queues[0].key(i, finish_at[c]), i), c, token[c]))
+
+    # Close the running slice on CPU c at the current time
+    def stop(c):
+        i = running[c]
+        ran = time - slice_start[c]
+        remaining[i] -= ran
+        busy[c] += ran
+        timelines[c].add(i, slice_start[c], time)
+        running[c] = None
+        token[c] += 1
+        return i
+
+    # Key of the process running on CPU c, as the ready queue would see it now
+    def running_key(c):
+        i = running[c]
+        return queue_of(c).key(i, finish_at[c] - time), i
+
+    # Process from the longest other queue, or None when every queue is empty
+    def steal():
+        while longest:
+            neg, v = longest[0]
+            size = len(queues[v])
+            if -neg == size and size:
+                i = queues[v].pop()
+                heapq.heapreplace(longest, (-(size - 1), v))
+                return i
+            heapq.heappop(longest)  # stale entry
+            if size:
+                heapq.heappush(longest, (-size, v))
+        return None
+
+    while completed < n:
+        while events and events[0][2] != token[events[0][1]]:
+            heapq.heappop(events)  # slice was cut short by a preemption
+        t_event = events[0][0] if events else None
+        t_arrival = at[arrivals[nxt]] if nxt < n else None
+        if t_event is None:
+            time = max(time, t_arrival)
+        elif t_arrival is None:
+            time = t_event
+        else:
+            time = min(t_event, t_arrival)
+
+        # Slices ending now
+        preempted, freed = [], []
+        while events and events[0][0] == time:
+            _, c, tok = heapq.heappop(events)
+            if tok != token[c]:
+                continue
+            i = stop(c)
+            heapq.heappush(idle, c)
+            freed.append(c)
+            if remaining[i] == 0:
+                completed += 1
+                tat[i] = time - at[i]
+                wt[i] = tat[i] - bt[i]
+            else:
+                preempted.append((c, i))
+
+        # Arrivals queue up ahead of processes whose quantum just ran out
+        touched = []
+        while nxt < n and at[arrivals[nxt]] <= time:
+            i = arrivals[nxt]
+            nxt += 1
+            c = placed % cpus
+            placed += 1
+            enqueue(c, i)
+            touched.append(c)
+        for c, i in preempted:
+            enqueue(c, i)
+
+        # Idle CPUs pick up work
+        if per_cpu:
+            # CPUs that just freed up or got arrivals run their own queue first,
+            # then any CPU still idle steals from the longest queue
+            for c in freed + touched:
+                if running[c] is None and len(queues[c]):
+                    dispatch(c, queues[c].pop())
+            while idle:
+                c = idle[0]
+                if running[c] is not None:
+                    heapq.heappop(idle)  # stale: busy with its own queue
+                    continue
+                i = steal()
+                if i is None:
+                    break
+                heapq.heappop(idle)
+                dispatch(c, i)
+        else:
+            q = queues[0]
+            while idle and len(q):
+                dispatch(heapq.heappop(idle), q.pop())
+
+        if not preemptive:
+            continue
+        # New arrivals may preempt a running process
+        if per_cpu:
+            for c in touched:
+                q = queues[c]
+                if running[c] is None or not len(q):
+                    continue
+                i = q.pop()
+                if (q.key(i, remaining[i]), i) < running_key(c):
+                    enqueue(c, stop(c))
+                    dispatch(c, i)
+                else:
+                    q.push(i, remaining[i])
+        else:
+            q = queues[0]
+            while len(q) and worst:
+                top = worst[0]
+                if top.token != token[top.cpu]:
+                    heapq.heappop(worst)  # CPU has moved on
+                    continue
+                i = q.pop()
+                if (q.key(i, remaining[i]), i) < running_key(top.cpu):
+                    heapq.heappop(worst)
+                    j = stop(top.cpu)
+                    q.push(j, remaining[j])
+                    dispatch(top.cpu, i)
+                else:
+                    q.push(i, remaining[i])
+                    break
+
+    start = at[arrivals[0]] if n else 0
+    return MulticoreResult(wt, tat, timelines, busy, start, time)
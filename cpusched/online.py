@@ -0,0 +1,156 @@
+# Online scheduling
+# Drives a policy from a live job feed: processes are submitted as they
+# become known, the clock is moved forward explicitly and metrics can be read
+# at any point. Every operation touches only the ready queue, the pending
+# arrivals and the running process, so each costs O(log n) amortized.
+#
+#   online = OnlineScheduler(SRTF())
+#   online.submit(Process("P1", 0, 5))
+#   finished = online.advance_to(10)
+#   online.snapshot()
+
+import heapq
+
+class OnlineScheduler:
+    # Pass a Timeline or list as `timeline` to record (arrival number, start,
+    # finish) slices. `on_dispatch(process, start, end)` is called whenever a
+    # slice is handed to the CPU; a preemptive policy may cut it short.
+    def __init__(self, scheduler, timeline=None, on_dispatch=None):
+        self.scheduler = scheduler
+        self.timeline = timeline
+        self.on_dispatch = on_dispatch
+        self.at, self.bt, self.priority = {}, {}, {}
+        self.active = {}      # arrival number -> Process, until it completes
+        self.remaining = {}   # work left, as of the start of the current slice
+        self.pending = []     # heap of (at, arrival number) not yet arrived
+        scheduler.reset(self.at, self.bt, self.priority)
+        self.time = 0
+        self.running = None   # arrival number of the running process
+        self.slice_start = self.slice_end = 0
+        self.submitted = 0
+        self.completed = 0
+        self.total_wt = self.total_tat = 0
+
+    # Add a process; it joins the ready queue once the clock reaches p.at
+    def submit(self, p):
+        if p.at < self.time:
+            raise ValueError(f"{p.pid} arrives at {p.at}, before the current time {self.time}")
+        i = self.submitted
+        self.submitted += 1
+        self.at[i], self.bt[i], self.priority[i] = p.at, p.bt, p.priority
+        self.active[i] = p
+        self.remaining[i] = p.bt
+        heapq.heappush(self.pending, (p.at, i))
+
+    # Move arrivals due by now into the ready queue
+    def _admit(self):
+        pending, push = self.pending, self.scheduler.push
+        while pending and pending[0][0] <= self.time:
+            _, i = heapq.heappop(pending)
+            push(i, self.remaining[i])
+
+    def _dispatch(self):
+        if self.scheduler.dynamic:
+            self.scheduler.at_time(self.time)
+        i = self.scheduler.pop()
+        run = self.remaining[i]
+        quantum = self.scheduler.quantum
+        if quantum is not None and run > quantum:
+            run = quantum
+        self.running = i
+        self.slice_start, self.slice_end = self.time, self.time + run
+        if self.on_dispatch is not None:
+            self.on_dispatch(self.active[i], self.slice_start, self.slice_end)
+
+    # Close the running slice at the current time; returns its process index
+    def _stop(self):
+        i = self.running
+        self.remaining[i] -= self.time - self.slice_start
+        if self.timeline is not None:
+            self.timeline.append((i, self.slice_start, self.time))
+        self.running = None
+        return i
+
+    # Run the simulation up to time t, including events at t itself; a process
+    # submitted later with at == t is queued behind them. Returns the
+    # processes that completed on the way, with WT/TAT set.
+    def advance_to(self, t):
+        if t < self.time:
+            raise ValueError(f"cannot move the clock back from {self.time} to {t}")
+        sched, pending, finished = self.scheduler, self.pending, []
+        while True:
+            if self.running is None:
+                self._admit()
+                if len(sched):
+                    self._dispatch()
+                    continue
+                if not pending or pending[0][0] > t:
+                    break
+                self.time = max(self.time, pending[0][0])  # idle until the next arrival
+                continue
+
+            arrival = pending[0][0] if pending else None
+            if arrival is not None and arrival < self.slice_end:
+                if arrival > t:
+                    break
+                self.time = arrival
+                if sched.preemptive:  # the new arrivals may take over the CPU
+                    i = self._stop()
+                    self._admit()
+                    sched.push(i, self.remaining[i])
+                else:
+                    self._admit()
+                continue
+
+            if self.slice_end > t:
+                break
+            self.time = self.slice_end
+            i = self._stop()
+            if self.remaining[i] == 0:  # process completed
+                p = self.active.pop(i)
+                del self.remaining[i], self.at[i], self.bt[i], self.priority[i]
+                if sched.dynamic:
+                    sched.done(i)
+                p.tat = self.time - p.at
+                p.wt = p.tat - p.bt
+                self.completed += 1
+                self.total_wt += p.wt
+                self.total_tat += p.tat
+                finished.append(p)
+            else:
+                self._admit()  # arrivals queue up ahead of the preempted process
+                sched.push(i, self.remaining[i])
+        self.time = t
+        return finished
+
+    # Run until every submitted process has completed
+    def drain(self):
+        finished = []
+        while self.running is not None or len(self.scheduler) or self.pending:
+            if self.running is not None:
+                target = self.slice_end
+            elif len(self.scheduler):
+                target = self.time  # dispatch now
+            else:
+                target = self.pending[0][0]
+            finished.extend(self.advance_to(max(target, self.time)))
+        return finished
+
+    # Current state and running aggregates over completed processes
+    def snapshot(self):
+        running = None
+        if self.running is not None:
+            i = self.running
+            running = {"pid": self.active[i].pid,
+                       "remaining": self.remaining[i] - (self.time - self.slice_start)}
+        n = self.completed
+        return {
+            "time": self.time,
+            "submitted": self.submitted,
+            "completed": n,
+            "pending": len(self.pending),
+            "ready": len(self.scheduler),
+            "running": running,
+            "avg_wt": self.total_wt / n if n else 0.0,
+            "avg_tat": self.total_tat / n if n else 0.0,
+        }
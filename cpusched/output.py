@@ -0,0 +1,257 @@
+# Bulk output
+# Tables and timelines are formatted into chunks of lines and written with one
+# write() per chunk instead of one print() per row or segment, which is what
+# dominates the run time of big traces otherwise.
+#
+# Table formats: text (the CLI layout), csv and jsonl.
+# Timeline formats: csv (id,start,finish) and binary: the magic b"CPTL"
+# followed by one little-endian int64 triple (id, start, finish) per slice,
+# readable with read_timeline() or numpy.fromfile(f, "<i8", offset=4).
+
+import json
+import sys
+from array import array
+from collections import deque
+
+from .timeline import Rounds, Timeline
+
+CHUNK = 4096  # lines per write
+TABLE_FORMATS = ("text", "csv", "jsonl")
+TIMELINE_FORMATS = ("csv", "binary")
+_MAGIC = b"CPTL"
+
+# Collects lines and writes them CHUNK at a time
+class LineWriter:
+    def __init__(self, out=None, chunk=CHUNK):
+        self.out = out if out is not None else sys.stdout
+        self.chunk = chunk
+        self.lines = []
+
+    def write(self, line):
+        self.lines.append(line)
+        if len(self.lines) >= self.chunk:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.out.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+
+# ---------- Tables ----------
+
+def table_header(fmt):
+    if fmt == "text":
+        return "Process\tAT\tBT\tWT\tTAT"
+    if fmt == "csv":
+        return "pid,at,bt,wt,tat"
+    return None
+
+def table_row(p, fmt):
+    if fmt == "text":
+        return f"{p.pid}\t{p.at}\t{p.bt}\t{p.wt}\t{p.tat}"
+    if fmt == "csv":
+        return f"{p.pid},{p.at},{p.bt},{p.wt},{p.tat}"
+    return json.dumps({"pid": p.pid, "at": p.at, "bt": p.bt, "wt": p.wt, "tat": p.tat})
+
+# Write processes (with WT/TAT set) as a table. Any iterable works, including
+# stream(), so rows can be written as processes complete.
+def write_table(processes, out=None, fmt="text"):
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"unknown table format: {fmt}")
+    writer = LineWriter(out)
+    header = table_header(fmt)
+    if header is not None:
+        writer.write(header)
+    for p in processes:
+        writer.write(table_row(p, fmt))
+    writer.flush()
+
+# ---------- Gantt chart ----------
+
+# The two text rows of a Gantt chart. With max_segments, only the first and
+# last max_segments // 2 segments are shown around a "..." marker.
+def gantt_rows(timeline, max_segments=None):
+    n = len(timeline)
+    if max_segments is not None and n > max_segments:
+        half = max(1, max_segments // 2)
+        return _gantt_rows(list(timeline[:half]) + [None] + list(timeline[n - half:]))
+    return _gantt_rows(list(timeline))
+
+# Segments are (pid, start, finish), or None for the "..." marker
+def _gantt_rows(segments):
+    top, bottom = [], []
+    for seg in segments:
+        if seg is None:
+            top.append("| ... ")
+            bottom.append(" " * 6)
+            continue
+        pid, s, f = seg
+        top.append(f"| {pid} ")
+        bottom.append(f"{s}".ljust(len(str(pid)) + 3))
+    top.append("|")
+    if segments:
+        bottom.append(f"{segments[-1][2]}")
+    return "".join(top), "".join(bottom)
+
+# Joins contiguous slices of the same process, as Timeline does: slices are
+# held back in `last` until one that cannot be merged arrives, then passed to
+# emit(). Call close() to emit the one still held.
+class _Merger:
+    def __init__(self, emit, merge=True):
+        self.emit, self.merge = emit, merge
+        self.last = None  # [id, start, finish] not yet emitted
+
+    def append(self, rec):
+        i, s, f = rec
+        last = self.last
+        if last is not None and self.merge and last[0] == i and last[2] == s:
+            last[2] = f
+            return
+        if last is not None:
+            self.emit(tuple(last))
+        self.last = [i, s, f]
+
+    def close(self):
+        if self.last is not None:
+            self.emit(tuple(self.last))
+            self.last = None
+
+# Keeps the first and last `keep` slices appended to it, for a truncated
+# Gantt chart of a streamed run in bounded memory. `labels(id)` gives the
+# pid shown for an id. Contiguous slices of a process are joined unless
+# merge is False.
+class GanttSample:
+    def __init__(self, keep=20, labels=None, merge=True):
+        self.head, self.tail = [], deque(maxlen=keep)
+        self.keep = keep
+        self.count = 0  # segments kept or dropped (all of them once rows() is called)
+        self.labels = labels
+        self.merger = _Merger(self._add, merge)
+
+    def _add(self, rec):
+        self.count += 1
+        if len(self.head) < self.keep:
+            self.head.append(rec)
+        else:
+            self.tail.append(rec)
+
+    def append(self, rec):
+        if isinstance(rec, Rounds):
+            self.extend(rec.slices())
+        else:
+            self.merger.append(rec)
+
+    def extend(self, recs):
+        for rec in recs:
+            self.append(rec)
+
+    # (top, bottom) rows, with "..." where slices were left out
+    def rows(self):
+        self.merger.close()
+        label = self.labels or (lambda i: i)
+        segments = [(label(i), s, f) for i, s, f in self.head]
+        if self.count > len(self.head) + len(self.tail):
+            segments.append(None)
+        segments.extend((label(i), s, f) for i, s, f in self.tail)
+        return _gantt_rows(segments)
+
+# ---------- Timelines ----------
+
+# Timeline sink that writes slices as they arrive; pass it to stream() or
+# simulate() as `timeline`, or feed it (id, start, finish) slices with
+# extend(). Contiguous slices of a process are joined into one row unless
+# merge is False, so the last row is only written by flush(): call it at the
+# end. The binary format needs numeric ids.
+class TimelineWriter:
+    def __init__(self, out, fmt="csv", chunk=CHUNK, merge=True):
+        if fmt not in TIMELINE_FORMATS:
+            raise ValueError(f"unknown timeline format: {fmt}")
+        self.out, self.fmt, self.chunk = out, fmt, chunk
+        self.count = 0
+        self.merger = _Merger(self._write, merge)
+        if fmt == "binary":
+            self.buffer = array("q")
+            out.write(_MAGIC)
+        else:
+            self.buffer = LineWriter(out, chunk)
+            self.buffer.write("id,start,finish")
+
+    def append(self, rec):
+        if isinstance(rec, Rounds):
+            self.extend(rec.slices())
+        else:
+            self.merger.append(rec)
+
+    def extend(self, recs):
+        for rec in recs:
+            self.append(rec)
+
+    def _write(self, rec):
+        i, s, f = rec
+        self.count += 1
+        if self.fmt == "binary":
+            self.buffer.extend((i, s, f))
+            if len(self.buffer) >= 3 * self.chunk:
+                self._flush_binary()
+        else:
+            self.buffer.write(f"{i},{s},{f}")
+
+    def _flush_binary(self):
+        if sys.byteorder != "little":
+            self.buffer.byteswap()
+        self.out.write(self.buffer.tobytes())
+        del self.buffer[:]
+
+    def flush(self):
+        self.merger.close()
+        if self.fmt == "binary":
+            self._flush_binary()
+        else:
+            self.buffer.flush()
+
+# Sends every slice to several timeline sinks (e.g. a TimelineWriter and a
+# GanttSample)
+class Tee:
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def append(self, rec):
+        for sink in self.sinks:
+            sink.append(rec)
+
+    def extend(self, recs):
+        for rec in recs:
+            self.append(rec)
+
+# Write a whole Timeline (CSV uses its pid labels, binary its numeric ids,
+# copied straight from the columns) or a list of slices
+def write_timeline(timeline, out, fmt="csv"):
+    if fmt == "binary" and isinstance(timeline, Timeline):
+        out.write(_MAGIC)
+        for k in range(0, len(timeline), CHUNK):
+            ids = timeline.ids[k:k + CHUNK]
+            rows = array("q", bytes(24 * len(ids)))
+            rows[0::3] = ids
+            rows[1::3] = timeline.starts[k:k + CHUNK]
+            rows[2::3] = timeline.finishes[k:k + CHUNK]
+            if sys.byteorder != "little":
+                rows.byteswap()
+            out.write(rows.tobytes())
+        return
+    writer = TimelineWriter(out, fmt, merge=getattr(timeline, "merge", True))
+    writer.extend(timeline)
+    writer.flush()
+
+# Read a binary timeline file back into a Timeline of numeric ids
+def read_timeline(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != _MAGIC or (len(data) - 4) % 24:
+        raise ValueError(f"{path} is not a binary timeline")
+    rows = array("q")
+    rows.frombytes(data[4:])
+    if sys.byteorder != "little":
+        rows.byteswap()
+    timeline = Timeline(merge=False)
+    timeline.ids, timeline.starts, timeline.finishes = rows[0::3], rows[1::3], rows[2::3]
+    return timeline
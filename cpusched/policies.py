@@ -0,0 +1,250 @@
+# Scheduling policies
+# A policy only decides which ready process runs next and for how long; the
+# simulation loop in engine.py is shared by all of them.
+
+from collections import deque
+import heapq
+
+# ---------- Policy interface ----------
+class Scheduler:
+    name = ""
+    preemptive = False  # re-pick the running process whenever a new one arrives
+    quantum = None      # longest slice a process may run (None = until done)
+    fast_forward = False     # apply whole quantum rounds at once when nothing changes
+    compress_rounds = False  # record those rounds as Rounds entries, not slices
+    dynamic = False  # call at_time() before each pop, re-read quantum after it
+                     # and call done() when a process completes
+
+    # Called by the engine before a run with the workload columns
+    def reset(self, at, bt, priority):
+        self.at, self.bt, self.priority = at, bt, priority
+        self.ready = []  # min-heap of (key, index)
+
+    # Sort key of a ready process; the index is appended to break ties
+    def key(self, i, remaining):
+        raise NotImplementedError
+
+    def push(self, i, remaining):
+        heapq.heappush(self.ready, (self.key(i, remaining), i))
+
+    def pop(self):
+        return heapq.heappop(self.ready)[1]
+
+    def __len__(self):
+        return len(self.ready)
+
+    # Ready processes in the order they will run (needed for fast_forward)
+    def queued(self):
+        raise NotImplementedError
+
+    # Dynamic policies: the clock reading before a dispatch
+    def at_time(self, time):
+        pass
+
+    # Dynamic policies: process i has completed, so any state kept for it can
+    # go (keeps streamed runs bounded by the processes in the system)
+    def done(self, i):
+        pass
+
+    # Constructor settings that change the schedule (the result cache keys
+    # on them); fixed at construction, unlike quantum during a run
+    def params(self):
+        return ()
+
+# ---------- FCFS ----------
+class FCFS(Scheduler):
+    name = "FCFS"
+
+    def key(self, i, remaining):
+        return self.at[i]
+
+# ---------- SJF (Non-preemptive) ----------
+class SJF(Scheduler):
+    name = "SJF (Non-Preemptive)"
+
+    def key(self, i, remaining):
+        return self.bt[i], self.at[i]  # shortest burst, earlier arrival on ties
+
+# ---------- SJF (Preemptive: Shortest Remaining Time First) ----------
+class SRTF(Scheduler):
+    name = "SJF (Preemptive)"
+    preemptive = True
+
+    def key(self, i, remaining):
+        return remaining
+
+# ---------- Priority (Non-preemptive) ----------
+class Priority(Scheduler):
+    name = "Priority (Non-Preemptive)"
+
+    def key(self, i, remaining):
+        return self.priority[i], self.at[i]  # lowest value, earlier arrival on ties
+
+# ---------- Priority (Preemptive) ----------
+class PriorityPreemptive(Scheduler):
+    name = "Priority (Preemptive)"
+    preemptive = True
+
+    def key(self, i, remaining):
+        return self.priority[i]
+
+# ---------- Round Robin ----------
+# compress_rounds keeps fast-forwarded rounds as Rounds records, which only a
+# list passed as the timeline holds on to; a Timeline (the default for run()
+# and run_table()) stores their slices.
+class RoundRobin(Scheduler):
+    name = "Round Robin"
+
+    def __init__(self, quantum, fast_forward=True, compress_rounds=False):
+        if quantum < 1:
+            raise ValueError("quantum must be a positive integer")
+        self.quantum = quantum
+        self.fast_forward = fast_forward
+        self.compress_rounds = compress_rounds
+
+    def params(self):
+        return (self.quantum,)
+
+    def reset(self, at, bt, priority):
+        Scheduler.reset(self, at, bt, priority)
+        self.ready = deque()  # FIFO ready queue
+
+    def push(self, i, remaining):
+        self.ready.append(i)
+
+    def pop(self):
+        return self.ready.popleft()
+
+    def queued(self):
+        return self.ready
+
+# ---------- Multilevel Feedback Queue ----------
+# quanta[k] is the time a process may use at level k before it is demoted to
+# level k + 1; the last level may be None to run to completion. New processes
+# start at level 0 and the lowest non-empty level runs, preempting lower
+# levels when a process arrives. A process preempted before using up its
+# allotment resumes ahead of the rest of its level. Every `boost` time units all ready
+# processes go back to level 0, and a process that has waited `aging` time
+# units is promoted one level (both off when None).
+# Each level is a heap of (enqueue time, seq, index), which is FIFO order and
+# also puts the longest waiter first for aging, so promotions and demotions
+# are O(log n).
+class MLFQ(Scheduler):
+    name = "MLFQ"
+    preemptive = True
+    dynamic = True
+
+    def __init__(self, quanta=(4, 8, 16), boost=None, aging=None):
+        quanta = tuple(quanta)
+        if not quanta or any(q is not None and q < 1 for q in quanta) or None in quanta[:-1]:
+            raise ValueError("quanta must be positive integers (the last one may be None)")
+        self.quanta = quanta
+        self.boost = boost
+        self.aging = aging
+
+    def params(self):
+        return (self.quanta, self.boost, self.aging)
+
+    def reset(self, at, bt, priority):
+        Scheduler.reset(self, at, bt, priority)
+        self.levels = [[] for _ in self.quanta]
+        self.level = {}    # index -> current level
+        self.used = {}     # index -> time used at the current level
+        self.left = {}     # index -> remaining work when last queued
+        self.resume = [None] * len(self.quanta)  # per level: process preempted mid-allotment
+        self.seq = 0
+        self.now = 0
+        self.next_boost = self.boost
+        self.quantum = None
+
+    def push(self, i, remaining):
+        if i not in self.level:  # new arrival
+            self.level[i], self.used[i] = 0, 0
+            when = self.at[i]
+        else:
+            ran = self.left[i] - remaining
+            when = self.now + ran
+            self.used[i] += ran
+            q = self.quanta[self.level[i]]
+            if q is None or self.used[i] < q:  # preempted by a higher level
+                self.left[i] = remaining
+                self.resume[self.level[i]] = i
+                return
+            if self.level[i] < len(self.quanta) - 1:  # allotment used up: demote
+                self.level[i] += 1
+            self.used[i] = 0
+        self.left[i] = remaining
+        self._enqueue(self.level[i], when, i)
+
+    def _enqueue(self, level, when, i):
+        self.seq += 1
+        heapq.heappush(self.levels[level], (when, self.seq, i))
+
+    def at_time(self, time):
+        self.now = time
+        levels = self.levels
+        if self.boost is not None and time >= self.next_boost:
+            self.next_boost = (time // self.boost + 1) * self.boost
+            waiting = [e for heap in levels for e in heap]
+            waiting.extend((time, 0, i) for i in self.resume if i is not None)
+            self.resume = [None] * len(levels)
+            for heap in levels:
+                heap.clear()
+            for when, _, i in sorted(waiting):
+                self.level[i], self.used[i] = 0, 0
+                self._enqueue(0, when, i)
+        if self.aging is not None:
+            for k in range(1, len(levels)):
+                heap = levels[k]
+                while heap and heap[0][0] + self.aging <= time:
+                    when, _, i = heapq.heappop(heap)
+                    self.level[i], self.used[i] = k - 1, 0
+                    self._enqueue(k - 1, when + self.aging, i)
+
+    def done(self, i):
+        del self.level[i], self.used[i], self.left[i]
+
+    def pop(self):
+        for k, heap in enumerate(self.levels):
+            i = self.resume[k]
+            if i is not None:
+                self.resume[k] = None
+                break
+            if heap:
+                i = heapq.heappop(heap)[2]
+                break
+        q = self.quanta[self.level[i]]
+        self.quantum = None if q is None else q - self.used[i]
+        return i
+
+    def __len__(self):
+        return sum(len(heap) for heap in self.levels) + len(self.resume) - self.resume.count(None)
+
+# Algorithm names accepted by make_scheduler
+ALGORITHMS = {
+    "fcfs": FCFS,
+    "sjf": SJF,
+    "sjf_preemptive": SRTF,
+    "priority": Priority,
+    "priority_preemptive": PriorityPreemptive,
+    "round_robin": RoundRobin,
+    "mlfq": MLFQ,
+}
+
+# Algorithms that take a quantum
+QUANTUM_ALGORITHMS = ("round_robin", "mlfq")
+
+# Build a policy from its name; round_robin and mlfq also need a quantum,
+# which mlfq doubles at each of its three levels
+def make_scheduler(name, quantum=None):
+    try:
+        cls = ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(f"unknown algorithm: {name}") from None
+    if name in QUANTUM_ALGORITHMS:
+        if quantum is None:
+            raise ValueError(f"{name} needs a quantum")
+        if cls is MLFQ:
+            return cls((quantum, 2 * quantum, 4 * quantum))
+        return cls(quantum)
+    return cls()
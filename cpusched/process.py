@@ -0,0 +1,13 @@
+# Process record shared by every scheduler and front end
+
+class Process:
+    # No per-instance __dict__: keeps millions of simulated jobs small
+    __slots__ = ("pid", "at", "bt", "priority", "wt", "tat")
+
+    def __init__(self, pid, at, bt, priority=0):
+        self.pid = pid           # Process ID
+        self.at = at             # Arrival Time
+        self.bt = bt             # Burst Time
+        self.priority = priority # Priority value (lower = higher priority)
+        self.wt = 0              # Waiting Time
+        self.tat = 0             # Turnaround Time
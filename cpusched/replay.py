@@ -0,0 +1,91 @@
+# Real-time replay with asyncio
+# Plays a trace against the wall clock: simulated time advances at `speed`
+# time units per second (float("inf") for as fast as possible), arrivals are
+# read from an async iterator and each slice is yielded as soon as it is
+# over. Waiting is done with asyncio.sleep, so any number of replays can run
+# side by side in one event loop:
+#
+#   async def main():
+#       runs = [collect(replay(aiter_workload(path), RoundRobin(q), speed=1000))
+#               for q in (2, 4, 8)]
+#       timelines = await asyncio.gather(*runs)
+
+import asyncio
+import inspect
+
+from .online import OnlineScheduler
+from .workload import iter_workload
+
+# Turns the (arrival number, start, finish) slices recorded by the online
+# scheduler into (pid, start, finish) while the process is still known
+class _SliceBuffer(list):
+    def __init__(self, online):
+        super().__init__()
+        self.online = online
+
+    def append(self, rec):
+        i, start, finish = rec
+        list.append(self, (self.online.active[i].pid, start, finish))
+
+# Async iterator over a workload file, giving other tasks a turn every
+# `batch` processes
+async def aiter_workload(path, batch=1000):
+    for n, p in enumerate(iter_workload(path), 1):
+        yield p
+        if n % batch == 0:
+            await asyncio.sleep(0)
+
+# Replay `arrivals` (an async iterable of Process objects sorted by arrival)
+# through `scheduler`, yielding (pid, start, finish) slices in time order.
+# `on_dispatch(process, start, end)` is called when a slice starts; if it
+# returns an awaitable (e.g. the real work for that slice) it runs as a task
+# and the replay waits for all of them before finishing.
+async def replay(arrivals, scheduler, speed=1.0, on_dispatch=None):
+    loop = asyncio.get_running_loop()
+    tasks = []
+
+    def dispatched(p, start, end):
+        result = on_dispatch(p, start, end)
+        if inspect.isawaitable(result):
+            tasks.append(asyncio.ensure_future(result))
+
+    online = OnlineScheduler(scheduler, on_dispatch=dispatched if on_dispatch else None)
+    online.timeline = slices = _SliceBuffer(online)
+    source = arrivals.__aiter__()
+    nxt = await anext(source, None)
+    origin = nxt.at if nxt is not None else 0  # first arrival plays at wall time 0
+    wall_start = loop.time()
+
+    while True:
+        # Next moment something happens: a slice ends, a dispatch, or an arrival
+        if online.running is not None:
+            event = online.slice_end
+        elif len(online.scheduler):
+            event = online.time
+        elif online.pending:
+            event = online.pending[0][0]
+        else:
+            event = None
+        if nxt is not None and (event is None or nxt.at < event):
+            event = nxt.at
+        if event is None:
+            break
+
+        # always awaited, so replays that are behind (or at infinite speed)
+        # still take turns with the other tasks in the loop
+        delay = wall_start + (event - origin) / speed - loop.time()
+        await asyncio.sleep(max(delay, 0))
+        while nxt is not None and nxt.at <= event:
+            online.submit(nxt)
+            nxt = await anext(source, None)
+        online.advance_to(event)
+        for s in slices:
+            yield s
+        slices.clear()
+
+    if tasks:
+        await asyncio.gather(*tasks)
+
+# Run a replay to the end and return its slices as a list
+async def collect(slices):
+    return [s async for s in slices]
@@ -0,0 +1,109 @@
+# Parallel parameter sweep
+# Runs every (trace, algorithm, quantum) combination on a process pool and
+# collects the averages into one comparison table. Each worker receives the
+# trace columns once, when it starts, and only reads them; results come back
+# as small dicts.
+#
+#   python -m cpusched.sweep TRACE [TRACE ...] --quantum 1 2 4 8 [--workers N]
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import ContextSwitch, simulate
+from .policies import ALGORITHMS, QUANTUM_ALGORITHMS, make_scheduler
+from .workload import is_binary, load_table, map_columns
+
+_traces = {}  # per worker: trace name -> (at, bt, priority, in arrival order)
+_costs = (0, 0)  # per worker: context-switch cost and warmup
+
+# Binary traces are sent as their path and mapped by each worker, so the
+# workers share the file's pages instead of holding copies
+def _init_worker(traces, costs):
+    global _traces, _costs
+    _traces = {name: map_columns(cols) if isinstance(cols, str) else cols
+               for name, cols in traces.items()}
+    _costs = costs
+
+def _run_one(task):
+    trace, algorithm, quantum = task
+    at, bt, priority, ordered = _traces[trace]
+    overhead = ContextSwitch(*_costs)
+    wt, tat, _ = simulate(at, bt, priority, make_scheduler(algorithm, quantum),
+                          timeline=False, overhead=overhead,
+                          order=range(len(at)) if ordered else None)
+    n = len(at)
+    span = overhead.finish - overhead.start
+    return {
+        "trace": trace,
+        "algorithm": algorithm,
+        "quantum": quantum,
+        "avg_wt": sum(wt) / n if n else 0.0,
+        "avg_tat": sum(tat) / n if n else 0.0,
+        "throughput": n / span if span else 0.0,
+        "switches": overhead.switches,
+        "overhead": overhead.overhead,
+        "utilization": overhead.utilization,
+    }
+
+# Sweep a grid of runs. `traces` maps a name to a ProcessTable (or to a file
+# path, which is loaded first); round_robin and mlfq run once per quantum, the other
+# algorithms once per trace. Every run charges `switch_cost` and `warmup` per
+# context switch (see ContextSwitch). Returns one result dict per run in grid
+# order.
+def sweep(traces, algorithms=None, quanta=(), workers=None, switch_cost=0, warmup=0):
+    columns = {}
+    for name, trace in traces.items():
+        if isinstance(trace, str) and is_binary(trace):
+            map_columns(trace)  # fail early on a damaged file
+            columns[name] = trace
+            continue
+        table = load_table(trace) if isinstance(trace, str) else trace
+        columns[name] = (table.at, table.bt, table.priority, table.by_arrival)
+    if algorithms is None:
+        algorithms = list(ALGORITHMS)
+
+    tasks = []
+    for name in columns:
+        for algorithm in algorithms:
+            if algorithm in QUANTUM_ALGORITHMS:
+                tasks.extend((name, algorithm, q) for q in quanta)
+            else:
+                tasks.append((name, algorithm, None))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(columns, (switch_cost, warmup))) as pool:
+        return list(pool.map(_run_one, tasks))
+
+def format_table(rows):
+    lines = [f"{'Trace':<20}{'Algorithm':<22}{'Quantum':>8}{'Avg WT':>14}{'Avg TAT':>14}"
+             f"{'Throughput':>12}{'Switches':>10}{'Overhead':>10}{'CPU util':>10}",
+             "-" * 120]
+    for r in rows:
+        q = "-" if r["quantum"] is None else r["quantum"]
+        lines.append(f"{r['trace']:<20}{r['algorithm']:<22}{q:>8}{r['avg_wt']:>14.2f}"
+                     f"{r['avg_tat']:>14.2f}{r['throughput']:>12.4f}{r['switches']:>10}"
+                     f"{r['overhead']:>10}{r['utilization']:>10.1%}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep scheduling algorithms and RR quanta")
+    parser.add_argument("traces", nargs="+", help="workload files (CSV or JSON Lines, optionally .gz, or .cpt)")
+    parser.add_argument("--algorithm", action="append", choices=list(ALGORITHMS),
+                        help="algorithm to include (repeatable, default: all)")
+    parser.add_argument("--quantum", type=int, nargs="+", default=[],
+                        help="round_robin/mlfq quanta to try")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--switch-cost", type=int, default=0, help="time units per context switch")
+    parser.add_argument("--warmup", type=int, default=0,
+                        help="extra work for a process after it is switched in")
+    args = parser.parse_args()
+
+    algorithms = args.algorithm or list(ALGORITHMS)
+    if not args.quantum:
+        for name in QUANTUM_ALGORITHMS:
+            if name in algorithms:
+                if args.algorithm:
+                    parser.error(f"{name} needs --quantum")
+                algorithms.remove(name)
+    print(format_table(sweep({path: path for path in args.traces}, algorithms,
+                             args.quantum, args.workers, args.switch_cost, args.warmup)))
@@ -0,0 +1,62 @@
+# Columnar process table
+# Stores every field in a typed array (8 bytes per value) instead of one
+# Process object per job, for workloads with millions of processes. The
+# engine reads the at/bt/priority columns directly and writes wt/tat back.
+
+import importlib.util
+from array import array
+
+from .process import Process
+
+class ProcessTable:
+    def __init__(self):
+        self.pids = None  # explicit pids, or None for the default P1, P2, ...
+        self.at = array("q")
+        self.bt = array("q")
+        self.priority = array("q")
+        self.wt = array("q")
+        self.tat = array("q")
+        self.by_arrival = False  # rows known to be in arrival order
+
+    def __len__(self):
+        return len(self.at)
+
+    def append(self, at, bt, priority=0, pid=None):
+        i = len(self.at)
+        if pid is not None and pid != f"P{i + 1}" and self.pids is None:
+            self.pids = [f"P{j + 1}" for j in range(i)]  # switch to stored pids
+        if self.pids is not None:
+            self.pids.append(pid if pid is not None else f"P{i + 1}")
+        self.at.append(at)
+        self.bt.append(bt)
+        self.priority.append(priority)
+        self.wt.append(0)
+        self.tat.append(0)
+
+    def pid(self, i):
+        return self.pids[i] if self.pids is not None else f"P{i + 1}"
+
+    # Build from any iterable of Process objects (e.g. iter_workload())
+    @classmethod
+    def from_processes(cls, processes):
+        table = cls()
+        for p in processes:
+            table.append(p.at, p.bt, p.priority, p.pid)
+        return table
+
+    # Process object for row i (created on demand)
+    def row(self, i):
+        p = Process(self.pid(i), self.at[i], self.bt[i], self.priority[i])
+        p.wt, p.tat = self.wt[i], self.tat[i]
+        return p
+
+    def to_processes(self):
+        return [self.row(i) for i in range(len(self))]
+
+    # Average waiting and turnaround time, with NumPy when it is installed
+    def averages(self):
+        n = len(self)
+        if n and importlib.util.find_spec("numpy") is not None:
+            from .vectorized import averages
+            return averages(self.wt, self.tat)
+        return sum(self.wt) / n, sum(self.tat) / n
@@ -0,0 +1,117 @@
+# Compact Gantt timeline
+# Slices are stored in three typed arrays (process id, start, finish) rather
+# than as a list of tuples, and a slice that continues the previous one (same
+# process, no gap) extends it instead of adding a row, so memory grows with
+# context switches, not with quanta or ticks. Process ids are small integers
+# (the row index in the workload); `labels` maps them back to pids.
+
+from array import array
+from bisect import bisect_right
+
+# A run of `count` identical round-robin rounds: every process in `order`
+# gets one `quantum` slice per round, starting at `start`. Stored in a
+# compressed timeline instead of count * len(order) separate slices.
+class Rounds:
+    __slots__ = ("order", "start", "quantum", "count")
+
+    def __init__(self, order, start, quantum, count):
+        self.order, self.start, self.quantum, self.count = order, start, quantum, count
+
+    @property
+    def finish(self):
+        return self.start + self.count * len(self.order) * self.quantum
+
+    def slices(self):
+        t, q = self.start, self.quantum
+        for _ in range(self.count):
+            for i in self.order:
+                yield i, t, t + q
+                t += q
+
+    # Same rounds with every entry of order passed through fn (e.g. index -> pid)
+    def relabel(self, fn):
+        return Rounds(tuple(fn(i) for i in self.order), self.start, self.quantum, self.count)
+
+    def __repr__(self):
+        return f"Rounds({self.order!r}, {self.start}, {self.quantum}, {self.count})"
+
+# Expand Rounds records in a timeline into plain (pid, start, finish) slices
+def expand(timeline):
+    for rec in timeline:
+        if isinstance(rec, Rounds):
+            yield from rec.slices()
+        else:
+            yield rec
+
+# Slices of a run, in time order
+class Timeline:
+    def __init__(self, labels=None, merge=True):
+        self.ids = array("q")
+        self.starts = array("q")
+        self.finishes = array("q")
+        self.labels = labels  # id -> pid: a sequence, a callable, or None for the id itself
+        self.merge = merge    # join a slice onto the previous one when contiguous
+
+    def add(self, i, start, finish):
+        ids, finishes = self.ids, self.finishes
+        if self.merge and ids and ids[-1] == i and finishes[-1] == start:
+            finishes[-1] = finish
+        else:
+            ids.append(i)
+            self.starts.append(start)
+            finishes.append(finish)
+
+    # List-style interface used by the engine: (id, start, finish) or Rounds.
+    # Rounds are stored as their slices (one slice when a single process runs
+    # them), so round compression only survives in a list timeline.
+    def append(self, rec):
+        if isinstance(rec, Rounds):
+            if len(rec.order) == 1:
+                self.add(rec.order[0], rec.start, rec.finish)
+            else:
+                self.extend(rec.slices())
+        else:
+            self.add(*rec)
+
+    def extend(self, recs):
+        for rec in recs:
+            self.append(rec)
+
+    def label(self, i):
+        labels = self.labels
+        if labels is None:
+            return i
+        return labels(i) if callable(labels) else labels[i]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[j] for j in range(*k.indices(len(self)))]
+        return self.label(self.ids[k]), self.starts[k], self.finishes[k]
+
+    # Slices are produced lazily as (pid, start, finish)
+    def __iter__(self):
+        label, starts, finishes = self.label, self.starts, self.finishes
+        for k, i in enumerate(self.ids):
+            yield label(i), starts[k], finishes[k]
+
+    # Slices overlapping the time window [t0, t1), found by binary search
+    def window(self, t0, t1):
+        k = bisect_right(self.finishes, t0)
+        label, ids, starts, finishes = self.label, self.ids, self.starts, self.finishes
+        while k < len(ids) and starts[k] < t1:
+            yield label(ids[k]), starts[k], finishes[k]
+            k += 1
+
+    @property
+    def start(self):
+        return self.starts[0] if self.starts else 0
+
+    @property
+    def finish(self):
+        return self.finishes[-1] if self.finishes else 0
+
+    def __repr__(self):
+        return f"Timeline({len(self)} slices, {self.start}-{self.finish})"
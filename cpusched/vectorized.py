@@ -0,0 +1,62 @@
+# NumPy backend for columnar workloads
+# Needs NumPy, an optional dependency: run_table() (for FCFS) and
+# ProcessTable.averages() only come here when NumPy is installed, and nothing
+# else in cpusched imports this module.
+# Inputs can be NumPy arrays, lists or ProcessTable columns; every result is
+# a NumPy array.
+
+from array import array
+
+import numpy as np
+
+from .timeline import Timeline
+
+def as_column(values):
+    return np.asarray(values, dtype=np.int64)
+
+# FCFS without a Python loop. In arrival order with cumulative bursts C, each
+# process finishes at C[k] + max(0, max over j <= k of at[j] - C[j-1]): the
+# running max carries the latest idle gap forward.
+# Arrivals already in order (`ordered` true, or found sorted when it is None)
+# skip the argsort and the scatter back into input order.
+# Returns (wt, tat, order, start, finish); wt/tat are in input order and the
+# timeline is order[k] running from start[k] to finish[k].
+def fcfs(at, bt, ordered=None):
+    at, bt = as_column(at), as_column(bt)
+    if ordered is None:
+        ordered = bool(np.all(at[1:] >= at[:-1]))
+    if ordered:
+        order, a, b = np.arange(len(at)), at, bt
+    else:
+        order = np.argsort(at, kind="stable")  # ties keep input order
+        a, b = at[order], bt[order]
+    done = np.cumsum(b)
+    finish = done + np.maximum(np.maximum.accumulate(a - (done - b)), 0)
+    start = finish - b
+    if ordered:
+        return start - a, finish - a, order, start, finish
+    wt, tat = np.empty_like(at), np.empty_like(at)
+    wt[order] = start - a
+    tat[order] = finish - a
+    return wt, tat, order, start, finish
+
+# Average waiting and turnaround time
+def averages(wt, tat):
+    return float(np.mean(as_column(wt))), float(np.mean(as_column(tat)))
+
+# FCFS over a ProcessTable, writing WT/TAT into its columns in place
+def fcfs_table(table):
+    wt, tat, order, start, finish = fcfs(table.at, table.bt, True if table.by_arrival else None)
+    np.frombuffer(table.wt, dtype=np.int64)[:] = wt
+    np.frombuffer(table.tat, dtype=np.int64)[:] = tat
+    return order, start, finish
+
+# run_table() for FCFS: WT/TAT into the table's columns, and a Timeline of
+# the slices labelled with the table's pids
+def run_fcfs_table(table):
+    order, start, finish = fcfs_table(table)
+    timeline = Timeline(table.pid)
+    timeline.ids = array("q", order.astype(np.int64).tobytes())
+    timeline.starts = array("q", start.tobytes())
+    timeline.finishes = array("q", finish.tobytes())
+    return timeline
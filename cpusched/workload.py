@@ -0,0 +1,190 @@
+# Workload files
+# Traces are read lazily, one Process at a time, so a file with millions of
+# jobs never has to be held in memory as text or as an intermediate list.
+#
+# CSV:        pid,at,bt[,priority] per line; a header row and lines starting
+#             with "#" are skipped.
+# JSON Lines: {"pid": ..., "at": ..., "bt": ..., "priority": ...} per line.
+# Either may be gzip-compressed (".gz" suffix).
+# Binary:     ".cpt" files: a 32-byte header (magic b"CPTR", version, job
+#             count, flags) followed by the at, bt and priority columns as
+#             little-endian int64. They are memory-mapped, not parsed: the
+#             columns are memoryviews over the file (wrap them with
+#             numpy.asarray() for arrays, also without copying), so opening a
+#             trace takes the same time whatever its size. Jobs are named
+#             P1, P2, ... in file order; the pids of a converted trace are not
+#             kept.
+
+import csv
+import gzip
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .process import Process
+from .table import ProcessTable
+
+def open_text(path, mode="r"):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", newline="")
+    return open(path, mode, newline="")
+
+def read_csv(path):
+    with open_text(path) as f:
+        for row in csv.reader(f):
+            if not row or row[0].startswith("#") or row[0] == "pid":
+                continue
+            priority = int(row[3]) if len(row) > 3 and row[3] else 0
+            yield Process(row[0], int(row[1]), int(row[2]), priority)
+
+def read_jsonl(path):
+    with open_text(path) as f:
+        for n, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            yield Process(rec.get("pid", f"P{n}"), int(rec["at"]), int(rec["bt"]),
+                          int(rec.get("priority", 0)))
+
+# ---------- Binary traces ----------
+
+BINARY_SUFFIX = ".cpt"
+_MAGIC = b"CPTR"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIqq8x")  # magic, version, jobs, flags
+_SORTED = 1  # flag: rows are in arrival order
+
+def is_binary(path):
+    return str(path).endswith(BINARY_SUFFIX)
+
+# Map a binary trace: returns (at, bt, priority, sorted) with read-only
+# int64 memoryviews as columns (copies on big-endian machines)
+def map_columns(path):
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mm) < _HEADER.size:
+        raise ValueError(f"{path} is not a binary trace")
+    magic, version, n, flags = _HEADER.unpack_from(mm)
+    if magic != _MAGIC or version != _VERSION or len(mm) != _HEADER.size + 24 * n:
+        raise ValueError(f"{path} is not a binary trace")
+    view = memoryview(mm)
+    columns = []
+    for k in range(3):
+        lo = _HEADER.size + 8 * n * k
+        column = view[lo:lo + 8 * n].cast("q")
+        if sys.byteorder != "little":
+            column = array("q", column)
+            column.byteswap()
+        columns.append(column)
+    return columns[0], columns[1], columns[2], bool(flags & _SORTED)
+
+def read_binary(path):
+    at, bt, priority, _ = map_columns(path)
+    for i, (a, b, p) in enumerate(zip(at, bt, priority)):
+        yield Process(f"P{i + 1}", a, b, p)
+
+# Little-endian int64 bytes of a column (list, array or NumPy array)
+def _column_bytes(column):
+    if sys.byteorder == "little":
+        try:
+            view = memoryview(column)
+        except TypeError:
+            view = None
+        if view is not None and view.itemsize == 8 and view.format in ("q", "l", "<q", "<l"):
+            return view.cast("B")
+    column = array("q", column)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return memoryview(column).cast("B")
+
+# Write n jobs given as (at, bt, priority) column chunks to a binary trace.
+# The file is sized up front and each chunk is copied into its place in the
+# three columns. `ordered` says whether the rows are in arrival order; when
+# None it is checked.
+def write_binary(path, n, chunks, ordered=None):
+    size = _HEADER.size + 24 * n
+    tmp = f"{path}.tmp"
+    with open(tmp, "w+b") as f:
+        f.truncate(size)
+        with mmap.mmap(f.fileno(), size) as mm:
+            k, last, ascending = 0, None, True
+            for at, bt, priority in chunks:
+                m = len(at)
+                if k + m > n:
+                    raise ValueError(f"more than {n} jobs")
+                for c, column in enumerate((at, bt, priority)):
+                    lo = _HEADER.size + 8 * (n * c + k)
+                    mm[lo:lo + 8 * m] = _column_bytes(column)
+                if ordered is None and m:
+                    view = memoryview(mm)[_HEADER.size + 8 * k:_HEADER.size + 8 * (k + m)].cast("q")
+                    if sys.byteorder != "little":
+                        view = array("q", view)
+                        view.byteswap()
+                    if ascending and last is not None and view[0] < last:
+                        ascending = False
+                    if ascending:
+                        ascending = all(a <= b for a, b in zip(view, view[1:]))
+                    last = view[-1]
+                    del view
+                k += m
+            if k != n:
+                raise ValueError(f"expected {n} jobs, got {k}")
+            flags = _SORTED if (ascending if ordered is None else ordered) else 0
+            _HEADER.pack_into(mm, 0, _MAGIC, _VERSION, n, flags)
+    os.replace(tmp, path)
+
+# Save a ProcessTable (or any object with at/bt/priority columns) as a
+# binary trace
+def save_table(path, table):
+    write_binary(path, len(table.at), [(table.at, table.bt, table.priority)])
+
+# Pick the reader from the file name (".cpt" binary, ".jsonl"/".ndjson" or
+# CSV otherwise)
+def iter_workload(path):
+    if is_binary(path):
+        return read_binary(path)
+    name = str(path)
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith((".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    return read_csv(path)
+
+# Whether a workload file is in arrival order: read from the header of a
+# binary trace, checked in one pass (stopping at the first row out of order)
+# for a text file
+def is_sorted(path):
+    if is_binary(path):
+        return map_columns(path)[3]
+    last = None
+    for p in iter_workload(path):
+        if last is not None and p.at < last:
+            return False
+        last = p.at
+    return True
+
+def load_workload(path):
+    return list(iter_workload(path))
+
+# Read a workload straight into a columnar ProcessTable. A binary trace is
+# mapped rather than read: its table is read-only, with the at/bt/priority
+# columns over the file and wt/tat in anonymous memory that is only touched
+# once results are written.
+def load_table(path):
+    if not is_binary(path):
+        return ProcessTable.from_processes(iter_workload(path))
+    table = ProcessTable()
+    table.at, table.bt, table.priority, table.by_arrival = map_columns(path)
+    n = len(table.at)
+    table.wt = memoryview(mmap.mmap(-1, 8 * n or 8)).cast("q")[:n]
+    table.tat = memoryview(mmap.mmap(-1, 8 * n or 8)).cast("q")[:n]
+    return table
+
+# Convert any workload file to a binary trace
+def convert(src, dst):
+    if not is_binary(dst):
+        raise ValueError(f"{dst}: binary traces need the {BINARY_SUFFIX} suffix")
+    save_table(dst, load_table(src))
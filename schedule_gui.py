@@ -1,193 +1,60 @@
-import customtkinter as ctk
-from tkinter import messagebox
-from collections import deque
+import argparse
 import random
-
-# ---------------- Process Class ----------------
-class Process:
-    def __init__(self, pid, at, bt, priority=0):
-        self.pid = pid # process ID 
-        self.at = at # arrival time
-        self.bt = bt # burst time
-        self.priority = priority # priority value 
-        self.wt = 0 # waiting time 
-        self.tat = 0 # turnaround time 
+import threading
+from bisect import bisect_left, bisect_right
+from cpusched import (
+    Process, FCFS, SJF, SRTF, Priority, PriorityPreemptive, RoundRobin, run, averages,
+    ALGORITHMS, QUANTUM_ALGORITHMS, ContextSwitch, ResultCache, make_scheduler, load_workload,
+    latency_stats, generate,
+)
+
+# customtkinter and tkinter are imported by load_toolkit() only when a window
+# is opened, so batch mode starts fast and works without a display server.
+ctk = None
+messagebox = None
+filedialog = None
+
+def load_toolkit():
+    global ctk, messagebox, filedialog
+    if ctk is None:
+        import customtkinter
+        from tkinter import messagebox as tk_messagebox, filedialog as tk_filedialog
+        ctk, messagebox, filedialog = customtkinter, tk_messagebox, tk_filedialog
 
 # ---------------- CPU Scheduling Functions ----------------
+# The algorithms live in the cpusched core library; these wrappers return the
+# execution order and timeline, for scripts that import this module. Results
+# are cached, so running the same input again after Back to Input is instant.
+
+results = ResultCache()
+
+def schedule(processes, scheduler, progress=None):
+    timeline = results.run(processes, scheduler, progress)
+    return [pid for pid, _, _ in timeline], timeline
 
 # First Come First Serve
 def fcfs(processes):
-    processes.sort(key=lambda x: x.at)   # Sort processes by arrival time
-    time, order, timeline = 0, [], []
-    for p in processes:
-        if time < p.at:   # If CPU is idle, jump to process arrival time
-            time = p.at
-        start = time                    # Start time of process
-        p.wt = time - p.at              # Waiting time = start time - arrival
-        time += p.bt                    # Advance time by burst
-        finish = time                   # Finish time of process
-        p.tat = p.wt + p.bt             # Turnaround = waiting + burst
-        order.append(p.pid)             # Record execution order
-        timeline.append((p.pid, start, finish))
-    return order, timeline
+    return schedule(processes, FCFS())
 
 # Shortest Job First (Non-preemptive)
 def sjf(processes):
-    processes.sort(key=lambda x: (x.at, x.bt))  # Sort by arrival, then burst
-    n, completed, time, order, timeline = len(processes), 0, 0, [], []
-    done = [False]*n
-    while completed < n:
-        # Collect ready processes (arrived and not done)
-        ready = [i for i, p in enumerate(processes) if p.at <= time and not done[i]]
-        if ready:
-            # Choose the one with smallest burst time
-            idx = min(ready, key=lambda i: processes[i].bt)
-            p = processes[idx]
-            start = time
-            p.wt = time - p.at
-            time += p.bt
-            finish = time
-            p.tat = p.wt + p.bt
-            done[idx] = True
-            completed += 1
-            order.append(p.pid)
-            timeline.append((p.pid, start, finish))
-        else:
-            time += 1  # CPU idle, move forward
-    return order, timeline
+    return schedule(processes, SJF())
 
 # SJF Preemptive 
 def sjf_preemptive(processes):
-    n, time, completed = len(processes), 0, 0
-    remaining = [p.bt for p in processes]
-    timeline, last_pid, start_time = [], None, 0
-    while completed < n:
-        ready = [i for i, p in enumerate(processes) if p.at <= time and remaining[i] > 0]
-        if ready:
-            idx = min(ready, key=lambda i: remaining[i])
-            p = processes[idx]
-            if last_pid != p.pid:
-                if last_pid is not None:
-                    timeline.append((last_pid, start_time, time))
-                start_time, last_pid = time, p.pid
-            remaining[idx] -= 1
-            time += 1
-            if remaining[idx] == 0:
-                completed += 1
-                p.tat = time - p.at
-                p.wt = p.tat - p.bt
-        else:
-            time += 1
-    timeline.append((last_pid, start_time, time))
-    return [pid for pid, _, _ in timeline], timeline
+    return schedule(processes, SRTF())
 
 # Priority Scheduling (Non-preemptive)
 def priority_scheduling(processes):
-    n, completed, time, order, timeline = len(processes), 0, 0, [], []
-    done = [False]*n
-    while completed < n:
-        # Collect ready processes
-        ready = [i for i, p in enumerate(processes) if p.at <= time and not done[i]]
-        if ready:
-            # Choose process with smallest priority value 
-            idx = min(ready, key=lambda i: processes[i].priority)
-            p = processes[idx]
-            start = time
-            p.wt = time - p.at
-            time += p.bt
-            finish = time
-            p.tat = p.wt + p.bt
-            done[idx] = True
-            completed += 1
-            order.append(p.pid)
-            timeline.append((p.pid, start, finish))
-        else:
-            time += 1  # CPU idle
-    return order, timeline
+    return schedule(processes, Priority())
 
 # Priority Preemptive
 def priority_preemptive(processes):
-    n, time, completed = len(processes), 0, 0
-    remaining = [p.bt for p in processes]
-    timeline, last_pid, start_time = [], None, 0
-    while completed < n:
-        ready = [i for i, p in enumerate(processes) if p.at <= time and remaining[i] > 0]
-        if ready:
-            idx = min(ready, key=lambda i: processes[i].priority)
-            p = processes[idx]
-            if last_pid != p.pid:
-                if last_pid is not None:
-                    timeline.append((last_pid, start_time, time))
-                start_time, last_pid = time, p.pid
-            remaining[idx] -= 1
-            time += 1
-            if remaining[idx] == 0:
-                completed += 1
-                p.tat = time - p.at
-                p.wt = p.tat - p.bt
-        else:
-            time += 1
-    timeline.append((last_pid, start_time, time))
-    return [pid for pid, _, _ in timeline], timeline
+    return schedule(processes, PriorityPreemptive())
 
 # Round Robin Scheduling
 def round_robin(processes, quantum):
-    n, time, order, timeline = len(processes), 0, [], []
-    queue = deque()                       # Ready queue
-    remaining_bt = [p.bt for p in processes]  # Remaining burst times
-    tat, wt, completed = [0]*n, [0]*n, [False]*n
-    processes.sort(key=lambda x: x.at)    # Sort by arrival time
-
-    # Load initial processes that have arrived at or before time 0
-    i = 0
-    while i < n and processes[i].at <= time:
-        queue.append(i)
-        i += 1
-
-    # If no process arrives at time 0, jump to the first arrival
-    if not queue and i < n:
-        time = processes[i].at
-        queue.append(i)
-        i += 1
-
-    while queue:
-        idx = queue.popleft()
-        p = processes[idx]
-        order.append(p.pid)   # Record execution order
-        start = time          
-
-        if remaining_bt[idx] > quantum:   # If needs more than quantum
-            time += quantum
-            remaining_bt[idx] -= quantum
-            finish = time         
-        else:                             # If finishes within quantum
-            time += remaining_bt[idx]
-            finish = time 
-            tat[idx] = time - p.at        # Turnaround time
-            wt[idx] = tat[idx] - p.bt     # Waiting time
-            remaining_bt[idx] = 0
-            completed[idx] = True
-        
-        timeline.append((p.pid, start, finish)) # record slice in gantt chart
-
-        # Add new arrivals that came during this time
-        while i < n and processes[i].at <= time:
-            queue.append(i); i += 1
-
-        # If process not finished, put it back in queue
-        if not completed[idx]:
-            queue.append(idx)
-
-        # If queue empty but there are still processes left, jump to next arrival
-        if not queue and i < n:
-            time = processes[i].at
-            queue.append(i); i += 1
-
-    # Save calculated WT and TAT back into process objects
-    for j in range(n):
-        processes[j].wt, processes[j].tat = wt[j], tat[j]
-
-    return order, timeline
+    return schedule(processes, RoundRobin(quantum))
 
 # ---------------- Animation Functions ----------------
 
@@ -203,10 +70,203 @@ def animate_entry(entry, final_value, delay=50, steps=10, min_val=0, max_val=15)
             entry.insert(0, str(final_value))
     step(steps)
 
+# ---------------- Output Views ----------------
+# Both views draw only what is on screen, so their cost depends on the window
+# size rather than on the number of slices or processes.
+
+GANTT_COLORS = ("#4e79a7", "#f28e2b", "#e15759", "#76b7b2", "#59a14f",
+                "#edc948", "#b07aa1", "#ff9da7", "#9c755f", "#86bcb6")
+MIXED_COLOR = "#9e9e9e"  # a pixel column covering several slices
+
+# Round a tick interval up to 1, 2 or 5 times a power of ten
+def nice_step(raw):
+    step = 1
+    while True:
+        for m in (1, 2, 5):
+            if step * m >= raw:
+                return step * m
+        step *= 10
+
+# Gantt chart drawn on a canvas. Each pixel column is looked up in the
+# timeline by binary search; columns showing one slice are joined into a bar
+# (labelled when wide enough) and columns holding several tiny slices are
+# drawn grey, so a redraw costs O(width * log n) at any zoom level.
+# Scroll to zoom around the pointer, drag to pan.
+class GanttView:
+    BAR_TOP, BAR_BOTTOM = 10, 50
+    MIN_SCALE = 1 / 40  # time units per pixel when fully zoomed in
+
+    def __init__(self, master, timeline):
+        self.timeline = timeline
+        self.canvas = ctk.CTkCanvas(master, height=85, bg="white", highlightthickness=0)
+        self.t0 = timeline.start
+        self.scale = None  # time units per pixel, set by fit() on first draw
+        self.drag = None
+        c = self.canvas
+        c.bind("<Configure>", lambda e: self.draw())
+        c.bind("<MouseWheel>", lambda e: self.zoom(0.8 if e.delta > 0 else 1.25, e.x))
+        c.bind("<Button-4>", lambda e: self.zoom(0.8, e.x))
+        c.bind("<Button-5>", lambda e: self.zoom(1.25, e.x))
+        c.bind("<ButtonPress-1>", lambda e: setattr(self, "drag", (e.x, self.t0)))
+        c.bind("<B1-Motion>", self.pan)
+
+    def width(self):
+        return max(1, self.canvas.winfo_width())
+
+    def fit(self):
+        span = max(1, self.timeline.finish - self.timeline.start)
+        self.t0 = self.timeline.start
+        self.scale = span / self.width()
+        self.draw()
+
+    # Zoom by `factor` keeping the time under pixel x in place
+    def zoom(self, factor, x=None):
+        if x is None:
+            x = self.width() // 2
+        t = self.t0 + x * self.scale
+        self.scale = max(self.MIN_SCALE, self.scale * factor)
+        self.t0 = t - x * self.scale
+        self.draw()
+
+    def pan(self, event):
+        x, t0 = self.drag
+        self.t0 = t0 - (event.x - x) * self.scale
+        self.draw()
+
+    def draw(self):
+        if self.scale is None:
+            self.fit()
+            return
+        c, tl = self.canvas, self.timeline
+        c.delete("all")
+        width, scale, t0 = self.width(), self.scale, self.t0
+        starts, finishes = tl.starts, tl.finishes
+
+        # Run-length encode the pixel columns: (key, first column), where key
+        # is a slice index, "mixed" or None for idle
+        runs = []
+        for x in range(width):
+            lo = t0 + x * scale
+            a = bisect_right(finishes, lo)
+            b = bisect_left(starts, lo + scale)
+            key = None if a >= b else a if b - a == 1 else "mixed"
+            if not runs or runs[-1][0] != key:
+                runs.append((key, x))
+        runs.append((None, width))
+
+        for (key, x0), (_, x1) in zip(runs, runs[1:]):
+            if key is None:
+                continue
+            if key == "mixed":
+                c.create_rectangle(x0, self.BAR_TOP, x1, self.BAR_BOTTOM,
+                                   fill=MIXED_COLOR, outline="")
+                continue
+            i = tl.ids[key]
+            c.create_rectangle(x0, self.BAR_TOP, x1, self.BAR_BOTTOM,
+                               fill=GANTT_COLORS[i % len(GANTT_COLORS)], outline="white")
+            text = str(tl.label(i))
+            if x1 - x0 > 8 * len(text) + 4:
+                c.create_text((x0 + x1) / 2, (self.BAR_TOP + self.BAR_BOTTOM) / 2,
+                              text=text, fill="white")
+
+        # Time axis with a tick roughly every 100 pixels
+        step = nice_step(100 * scale)
+        t = (int(t0) // step) * step
+        while t <= t0 + width * scale:
+            x = (t - t0) / scale
+            if x >= 0:
+                c.create_line(x, self.BAR_BOTTOM, x, self.BAR_BOTTOM + 6)
+                c.create_text(x, self.BAR_BOTTOM + 8, text=str(t), anchor="n")
+            t += step
+
+# Process table drawn on a canvas one visible row at a time, with its own
+# scrollbar, so it opens instantly however many processes there are
+class TableView:
+    ROW_HEIGHT = 20
+    FONT = ("Courier New", 12)
+
+    def __init__(self, master, processes):
+        self.processes = processes
+        self.first = 0  # index of the top visible row
+        self.frame = ctk.CTkFrame(master)
+        self.canvas = ctk.CTkCanvas(self.frame, bg="white", highlightthickness=0)
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        c = self.canvas
+        c.bind("<Configure>", lambda e: self.draw())
+        c.bind("<MouseWheel>", lambda e: self.yview("scroll", -1 if e.delta > 0 else 1, "units"))
+        c.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+        c.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+
+    def rows(self):
+        return max(1, self.canvas.winfo_height() // self.ROW_HEIGHT - 1)
+
+    # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+    def yview(self, *args):
+        n, rows = len(self.processes), self.rows()
+        if args[0] == "moveto":
+            self.first = int(float(args[1]) * n)
+        elif args[0] == "scroll":
+            self.first += int(args[1]) * (rows if args[2] == "pages" else 3)
+        self.first = max(0, min(self.first, n - rows))
+        self.draw()
+
+    def draw(self):
+        c, h = self.canvas, self.ROW_HEIGHT
+        c.delete("all")
+        c.create_text(5, 2, anchor="nw", font=self.FONT,
+                      text=f"{'Process':<10}{'AT':<10}{'BT':<10}{'WT':<10}{'TAT':<10}")
+        c.create_line(0, h, c.winfo_width(), h)
+        n, rows = len(self.processes), self.rows()
+        last = min(n, self.first + rows)
+        for row, p in enumerate(self.processes[self.first:last], 1):
+            c.create_text(5, row * h + 2, anchor="nw", font=self.FONT,
+                          text=f"{p.pid:<10}{p.at:<10}{p.bt:<10}{p.wt:<10}{p.tat:<10}")
+        if n:
+            self.scrollbar.set(self.first / n, last / n)
+
 # ---------------- Run Algorithm and Output Functions ----------------
 
+# Raised from the progress callback to stop a simulation the user cancelled
+class Cancelled(Exception):
+    pass
+
+# A simulation running on a worker thread. The thread only writes to these
+# attributes; the Tk side reads them from poll_simulation().
+class Simulation:
+    def __init__(self, processes, scheduler):
+        self.processes = processes
+        self.scheduler = scheduler
+        self.done = 0
+        self.cancelled = False
+        self.result = None  # timeline
+        self.stats = None   # LatencyStats of the result
+        self.error = None
+        self.thread = threading.Thread(target=self.work, daemon=True)
+
+    def progress(self, done, n):
+        self.done = done
+        if self.cancelled:
+            raise Cancelled()
+
+    def work(self):
+        try:
+            # the output window only needs the timeline, not schedule()'s order
+            timeline = results.run(self.processes, self.scheduler, self.progress)
+            # a full pass over the timeline, so it stays off the Tk thread too
+            self.stats = latency_stats(self.processes, timeline)
+            self.result = timeline
+        except Cancelled:
+            pass
+        except Exception as exc:
+            self.error = exc
+
 # Run the selected scheduling algorithm
 def run_algorithm():
+    load_toolkit()
+    if simulation is not None:
+        return  # one simulation at a time
     algo = algo_choice.get()
     try:
         n = int(entry_n.get())
@@ -217,35 +277,72 @@ def run_algorithm():
     processes = []
     for i in range(n):
         try:
-            at = int(entries[i][0].get())
-            bt = int(entries[i][1].get())
-            pr = int(entries[i][2].get()) if "Priority" in algo_choice.get() else 0
-            processes.append(Process(f"P{i + 1}", at, bt, pr))
+            at, bt, pr = grid.get(i)
+            pr = int(pr) if "Priority" in algo_choice.get() else 0
+            processes.append(Process(grid.pid(i), int(at), int(bt), pr))
         except:
             messagebox.showerror("Error", f"Invalid input in Process {i + 1}")
             return
 
-    # Run chosen algorithm
+    # Pick the chosen algorithm
     if algo.startswith("FCFS"):
-        order, timeline = fcfs(processes)
+        scheduler = FCFS()
     elif algo.startswith("SJF") and "Non" in algo:
-        order, timeline = sjf(processes)
+        scheduler = SJF()
     elif algo.startswith("SJF") and "Preemptive" in algo:
-        order, timeline = sjf_preemptive(processes)
+        scheduler = SRTF()
     elif algo.startswith("Priority") and "Non" in algo:
-        order, timeline = priority_scheduling(processes)
+        scheduler = Priority()
     elif algo.startswith("Priority") and "Preemptive" in algo:
-        order, timeline = priority_preemptive(processes)
+        scheduler = PriorityPreemptive()
     elif algo.startswith("Round Robin"):
         try:
-            q = int(entry_q.get())
-            order, timeline = round_robin(processes, q)
+            scheduler = RoundRobin(int(entry_q.get()))
         except:
             messagebox.showerror("Error", "Enter a valid quantum")
             return
 
-    avg_wt = sum(p.wt for p in processes) / n
-    avg_tat = sum(p.tat for p in processes) / n
+    start_simulation(processes, scheduler)
+
+# Start the simulation on a worker thread and show its progress below the
+# Run button until it finishes or is cancelled
+def start_simulation(processes, scheduler):
+    global simulation
+    simulation = Simulation(processes, scheduler)
+    btn_run.configure(state="disabled")
+    progress_bar.set(0)
+    progress_label.configure(text=f"Simulating 0 / {len(processes)}")
+    progress_frame.pack(pady=(0, 10), anchor="center")
+    simulation.thread.start()
+    root.after(POLL_MS, poll_simulation)
+
+def cancel_simulation():
+    if simulation is not None:
+        simulation.cancelled = True
+
+def poll_simulation():
+    global simulation
+    sim = simulation
+    n = len(sim.processes)
+    if sim.thread.is_alive():
+        progress_bar.set(sim.done / n if n else 1)
+        progress_label.configure(
+            text="Cancelling..." if sim.cancelled else f"Simulating {sim.done} / {n}")
+        root.after(POLL_MS, poll_simulation)
+        return
+
+    simulation = None
+    progress_frame.pack_forget()
+    btn_run.configure(state="normal")
+    if sim.error is not None:
+        messagebox.showerror("Error", f"Simulation failed: {sim.error}")
+    elif sim.result is not None:
+        show_results(sim.processes, sim.result, sim.stats)
+
+# Show the results of a finished simulation, with its latency stats, in a new
+# window
+def show_results(processes, timeline, stats):
+    avg_wt, avg_tat = averages(processes)
 
     # Hide input window
     root.withdraw()
@@ -257,48 +354,30 @@ def run_algorithm():
 
     ctk.CTkLabel(output_win, text="OUTPUT", font=ctk.CTkFont(size=18, weight="bold")).pack(pady=10)
 
-    result_text = ctk.CTkTextbox(output_win, width=760, height=450, wrap="none")
-    result_text.pack(padx=10, pady=10, fill="both", expand=True)
-    result_text.configure(font=("Courier New", 14))
-
-    #Gantt Chart 
-    result_text.insert("end", "Gantt Chart:\n")
-
-    label_timeline = "Process Timeline:"
-    label_finish   = "Finish Times:"
-    pad = max(len(label_timeline), len(label_finish))
-    label_timeline = label_timeline.ljust(pad)
-    label_finish   = label_finish.ljust(pad)
-
-    segments = [f"| {pid} " for pid, _, _ in timeline]
-    widths = [len(seg) for seg in segments]
-
-    # Top row
-    result_text.insert("end", label_timeline + "  ")
-    for seg in segments:
-        result_text.insert("end", seg)
-    result_text.insert("end", "|\n")
-
-    # Bottom row 
-    result_text.insert("end", label_finish + "  ")
-    for (pid, s, f), w in zip(timeline, widths):
-        result_text.insert("end", str(s).ljust(w))  
+    # Gantt chart
+    ctk.CTkLabel(output_win, text="Gantt Chart (scroll to zoom, drag to pan):").pack(anchor="w", padx=10)
     if timeline:
-        result_text.insert("end", str(timeline[-1][2]) + "\n\n")
+        gantt = GanttView(output_win, timeline)
+        gantt.canvas.pack(padx=10, fill="x")
+        zoom_frame = ctk.CTkFrame(output_win, fg_color="transparent")
+        zoom_frame.pack(pady=5)
+        ctk.CTkButton(zoom_frame, text="Zoom In", width=90,
+                      command=lambda: gantt.zoom(0.5)).pack(side="left", padx=5)
+        ctk.CTkButton(zoom_frame, text="Zoom Out", width=90,
+                      command=lambda: gantt.zoom(2)).pack(side="left", padx=5)
+        ctk.CTkButton(zoom_frame, text="Fit", width=90, command=gantt.fit).pack(side="left", padx=5)
     else:
-        result_text.insert("end", "\n(No timeline generated)\n\n")
+        ctk.CTkLabel(output_win, text="(No timeline generated)").pack()
 
-    # Process Table 
-    header = f"{'Process':<10}{'AT':<10}{'BT':<10}{'WT':<10}{'TAT':<10}\n"
-    result_text.insert("end", header)
-    result_text.insert("end", "-" * 50 + "\n")
-    for p in processes:
-        row = f"{p.pid:<10}{p.at:<10}{p.bt:<10}{p.wt:<10}{p.tat:<10}\n"
-        result_text.insert("end", row)
+    # Process table
+    table = TableView(output_win, processes)
+    table.frame.pack(padx=10, pady=10, fill="both", expand=True)
 
-    result_text.insert("end", f"\nAverage Waiting Time = {avg_wt:.2f}\n")
-    result_text.insert("end", f"Average Turnaround Time = {avg_tat:.2f}\n")
-    result_text.configure(state="disabled")
+    ctk.CTkLabel(output_win, text=f"Average Waiting Time = {avg_wt:.2f}    "
+                                  f"Average Turnaround Time = {avg_tat:.2f}",
+                 font=("Courier New", 14)).pack()
+    ctk.CTkLabel(output_win, text="\n".join(stats.format()),
+                 font=("Courier New", 12), justify="left").pack()
 
     # Back button
     def back_to_input():
@@ -308,47 +387,127 @@ def run_algorithm():
     ctk.CTkButton(output_win, text="Back to Input", command=back_to_input).pack(pady=15)
 
 
+# ---------------- Process Input Grid ----------------
+
+# Process input table. The values live in `values` (one [at, bt, priority]
+# list of strings per process) and only VISIBLE_ROWS rows of entry widgets
+# exist; scrolling saves what is on screen and loads the next rows into the
+# same widgets, so the grid builds instantly for any n.
+class ProcessGrid:
+    VISIBLE_ROWS = 12
+
+    def __init__(self, master, n, priority, pids=None):
+        self.values = [["", "", ""] for _ in range(n)]
+        self.pids = pids  # None for P1, P2, ...
+        self.first = 0  # process shown in the top row
+        self.frame = ctk.CTkFrame(master, fg_color="transparent")
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self.yview)
+        self.scrollbar.grid(row=0, column=7, rowspan=self.VISIBLE_ROWS, sticky="ns")
+        self.rows = []
+        self.priority_cells = []  # (row, label, entry) of the priority column
+        for r in range(min(n, self.VISIBLE_ROWS)):
+            label = ctk.CTkLabel(self.frame, text="", width=40)
+            label.grid(row=r, column=0, padx=5, pady=2)
+            cells = []
+            for c, text in enumerate(("Arrival Time:", "Burst Time:", "Priority:")):
+                entry = ctk.CTkEntry(self.frame, width=60, justify="center")
+                caption = ctk.CTkLabel(self.frame, text=text)
+                if c < 2:
+                    caption.grid(row=r, column=2 * c + 1, padx=5)
+                    entry.grid(row=r, column=2 * c + 2, padx=5)
+                else:
+                    self.priority_cells.append((r, caption, entry))
+                entry.bind("<MouseWheel>", lambda e: self.yview("scroll", -1 if e.delta > 0 else 1, "units"))
+                entry.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+                entry.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+                cells.append(entry)
+            self.rows.append((label, cells))
+        self.show_priority(priority)
+        self.load()
+
+    # Show or hide the priority column; its values are kept either way
+    def show_priority(self, shown):
+        for r, caption, entry in self.priority_cells:
+            if shown:
+                caption.grid(row=r, column=5, padx=5)
+                entry.grid(row=r, column=6, padx=5)
+            else:
+                caption.grid_remove()
+                entry.grid_remove()
+
+    def __len__(self):
+        return len(self.values)
+
+    def pid(self, i):
+        return self.pids[i] if self.pids is not None else f"P{i + 1}"
+
+    # Copy the visible entries into the model
+    def save(self):
+        for k, (_, cells) in enumerate(self.rows):
+            self.values[self.first + k] = [e.get() for e in cells]
+
+    # Show the model rows starting at self.first
+    def load(self):
+        for k, (label, cells) in enumerate(self.rows):
+            i = self.first + k
+            label.configure(text=self.pid(i))
+            for e, value in zip(cells, self.values[i]):
+                e.delete(0, "end")
+                e.insert(0, value)
+        n = len(self.values)
+        if n:
+            self.scrollbar.set(self.first / n, (self.first + len(self.rows)) / n)
+
+    # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+    def yview(self, *args):
+        self.save()
+        n = len(self.values)
+        if args[0] == "moveto":
+            self.first = int(float(args[1]) * n)
+        elif args[0] == "scroll":
+            self.first += int(args[1]) * (len(self.rows) if args[2] == "pages" else 1)
+        self.first = max(0, min(self.first, n - len(self.rows)))
+        self.load()
+
+    # Replace every value at once (generated or imported workloads)
+    def fill(self, values):
+        self.values = values
+        self.load()
+
+    # The [at, bt, priority] strings of process i
+    def get(self, i):
+        if self.first <= i < self.first + len(self.rows):
+            return [e.get() for e in self.rows[i - self.first][1]]
+        return self.values[i]
+
+    # Entry widgets of process i if it is on screen, else None
+    def widgets(self, i):
+        if self.first <= i < self.first + len(self.rows):
+            return self.rows[i - self.first][1]
+        return None
+
 # ---------------- Entry Field Creation Functions ----------------
 
-# Create entry fields for process input
-def create_entries():
+ANIMATE_MAX = ProcessGrid.VISIBLE_ROWS  # larger workloads are filled in without animation
+
+# Create the process input grid
+def create_entries(pids=None):
+    global grid
     # clear old widgets
     for widget in frame_inputs.winfo_children():
         widget.destroy()
+    grid = None
 
     try:
         n = int(entry_n.get())
     except:
         return
 
-    global entries
-    entries = []
-
     is_priority = "Priority" in algo_choice.get()  # check if priority is needed
+    grid = ProcessGrid(frame_inputs, n, is_priority, pids)
+    grid.frame.pack(fill="both", expand=True)
 
-    for i in range(n):
-        ctk.CTkLabel(frame_inputs, text=f"P{i + 1} Arrival Time:").grid(row=i, column=0, padx=5, pady=2)
-        at_entry = ctk.CTkEntry(frame_inputs, width=60, justify="center")
-        at_entry.grid(row=i, column=1, padx=5)
-
-        ctk.CTkLabel(frame_inputs, text="Burst Time:").grid(row=i, column=2, padx=5)
-        bt_entry = ctk.CTkEntry(frame_inputs, width=60, justify="center")
-        bt_entry.grid(row=i, column=3, padx=5)
-
-        # create a priority entry widget if required; otherwise create a placeholder entry
-        if is_priority:
-            ctk.CTkLabel(frame_inputs, text="Priority:").grid(row=i, column=4, padx=5)
-            pr_entry = ctk.CTkEntry(frame_inputs, width=60, justify="center")
-            pr_entry.grid(row=i, column=5, padx=5)
-        else:
-            # placeholder entry (not gridded) so entries[i][2] still exists and can be safely read/animated
-            pr_entry = ctk.CTkEntry(frame_inputs, width=60, justify="center")
-
-        entries.append((at_entry, bt_entry, pr_entry))
-
-
-
-# Auto-generate random process data
+# Auto-generate process data with the synthetic workload generator
 def auto_generate():
     try:
         n = int(entry_n.get())
@@ -356,35 +515,48 @@ def auto_generate():
         messagebox.showerror("Error", "Enter a valid number of processes first")
         return
 
-    # Ensure entry fields exist and match n; create them if they don't
-    if 'entries' not in globals() or not entries or len(entries) != n:
+    # Ensure the grid exists and matches n; create it if it doesn't
+    if grid is None or len(grid) != n:
         create_entries()
 
-    # After create_entries, validate again
-    if 'entries' not in globals() or not entries or len(entries) != n:
-        messagebox.showerror("Error", "Please click 'Set Processes' first before Auto Generate.")
-        return
-
+    # Poisson arrivals at 80% load with heavy-tailed bursts of 1-15 units;
+    # priorities lean towards burst length. They are filled in even while the
+    # priority column is hidden, so switching to a priority algorithm keeps
+    # the workload complete.
     is_priority = "Priority" in algo_choice.get()
+    table = generate(n, mean_burst=6, max_burst=15, utilization=0.8)
+    values = [[str(at), str(bt), str(pr)]
+              for at, bt, pr in zip(table.at, table.bt, table.priority)]
+    grid.fill(values)
+
+    # Small workloads fit on screen, so animate the entries as before
+    if n <= ANIMATE_MAX:
+        last = max(table.at, default=0)
+        for i, (at, bt, pr) in enumerate(values):
+            at_entry, bt_entry, pr_entry = grid.widgets(i)
+            animate_entry(at_entry, at, min_val=0, max_val=max(last, 15))
+            animate_entry(bt_entry, bt, min_val=1, max_val=15)
+            if is_priority:
+                animate_entry(pr_entry, pr, min_val=1, max_val=5)
+
+# Load a workload file (pid,at,bt[,priority] CSV, JSON Lines or .cpt) straight
+# into the grid
+def import_workload():
+    path = filedialog.askopenfilename(
+        title="Import Workload",
+        filetypes=[("Workloads", "*.csv *.jsonl *.ndjson *.gz *.cpt"), ("All files", "*")])
+    if not path:
+        return
+    try:
+        workload = load_workload(path)
+    except (OSError, ValueError) as exc:
+        messagebox.showerror("Error", f"Cannot import {path}: {exc}")
+        return
 
-    # Populate values with animation (or instant if you prefer)
-    for i in range(n):
-        at = random.randint(0, 15)
-        bt = random.randint(1, 15)
-
-        # animate_entry expects a widget (entry) — entries[i][0] and [1] exist
-        animate_entry(entries[i][0], at, min_val=0, max_val=15)
-        animate_entry(entries[i][1], bt, min_val=1, max_val=15)
-
-        if is_priority:
-            pr = random.randint(1, 5)
-            animate_entry(entries[i][2], pr, min_val=1, max_val=5)
-        else:
-            # Optional: clear placeholder so it doesn't contain stale data
-            entries[i][2].delete(0, "end")
-
-
-
+    entry_n.delete(0, "end")
+    entry_n.insert(0, str(len(workload)))
+    create_entries([p.pid for p in workload])
+    grid.fill([[str(p.at), str(p.bt), str(p.priority)] for p in workload])
 
 # ---------------- Utility Functions ----------------
 
@@ -396,20 +568,35 @@ def center_window(root, width=1200, height=700):
     y = (screen_height - height) // 2
     root.geometry(f"{width}x{height}+{x}+{y}")
 
-# Show quantum input field only when RR is selected
+# Show quantum input field only when RR is selected, and the priority column
+# only for the priority algorithms. A grid that still has the requested number
+# of rows keeps its values (e.g. an imported or generated workload).
 def show_hide_quantum(choice):
     if choice == "Round Robin":
         quantum_frame.grid()
     else:
         quantum_frame.grid_remove()
-    create_entries()
+    try:
+        n = int(entry_n.get())
+    except ValueError:
+        n = None
+    if grid is not None and len(grid) == n:
+        grid.show_priority("Priority" in choice)
+    else:
+        create_entries()
 
 # ---------------- Main Window ----------------
 
+POLL_MS = 50  # how often the window checks on a running simulation
+simulation = None
+grid = None  # the ProcessGrid of the input window
+
 def main():
+    load_toolkit()
     ctk.set_appearance_mode("System")
     ctk.set_default_color_theme("blue")
-    global algo_choice, entry_n, entry_q, frame_inputs, quantum_frame, entries, root
+    global algo_choice, entry_n, entry_q, frame_inputs, quantum_frame, grid, root
+    global btn_run, progress_frame, progress_bar, progress_label
 
     root = ctk.CTk()
     root.title("CPU Scheduling Simulator")
@@ -449,6 +636,7 @@ def main():
     entry_n = ctk.CTkEntry(controls_frame, width=140, justify="center")
     entry_n.grid(row=1, column=1, padx=10, pady=(0, 5))
     ctk.CTkButton(controls_frame, text="Set Processes", command=create_entries, width=140).grid(row=2, column=1, padx=10, pady=(0, 10))
+    ctk.CTkButton(controls_frame, text="Import Workload", command=import_workload, width=140).grid(row=3, column=0, columnspan=2, pady=(0, 10))
 
     # Quantum (hidden unless Round Robin is selected)
     quantum_frame = ctk.CTkFrame(controls_frame, fg_color="transparent")
@@ -458,16 +646,66 @@ def main():
     quantum_frame.grid(row=0, column=2, rowspan=3, padx=10, pady=5)
     quantum_frame.grid_remove()
 
-    # Scrollable frame for process inputs
-    frame_inputs = ctk.CTkScrollableFrame(left_frame, width=580, height=300)
+    # Frame for the process input grid
+    frame_inputs = ctk.CTkFrame(left_frame, width=580, height=300)
     frame_inputs.pack(pady=10, padx=10, fill="both", expand=True)
 
     # Run button
     btn_run = ctk.CTkButton(left_frame, text="Run Simulation", command=run_algorithm)
     btn_run.pack(pady=10, anchor="center")
 
+    # Progress of a running simulation (shown only while one runs)
+    progress_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
+    progress_label = ctk.CTkLabel(progress_frame, text="")
+    progress_label.pack()
+    progress_bar = ctk.CTkProgressBar(progress_frame, width=300)
+    progress_bar.pack(side="left", padx=5)
+    ctk.CTkButton(progress_frame, text="Cancel", command=cancel_simulation,
+                  width=80).pack(side="left", padx=5)
+
     root.mainloop()
 
+# ---------------- Batch Mode ----------------
+
+# Run algorithms on a workload file without opening a window and print the
+# averages of each one, with the context-switch count, the time lost to
+# switch_cost/warmup and the resulting CPU utilization. round_robin and mlfq
+# are only run when a quantum is given.
+def run_batch(path, algorithms=None, quantum=None, switch_cost=0, warmup=0):
+    workload = load_workload(path)
+    if algorithms is None:
+        algorithms = [name for name in ALGORITHMS
+                      if name not in QUANTUM_ALGORITHMS or quantum is not None]
+
+    print(f"{'Algorithm':<22}{'Avg WT':>12}{'Avg TAT':>12}{'Switches':>10}{'Overhead':>10}{'CPU util':>10}")
+    print("-" * 76)
+    for name in algorithms:
+        # fresh copies so every algorithm starts from the same workload
+        processes = [Process(p.pid, p.at, p.bt, p.priority) for p in workload]
+        overhead = ContextSwitch(switch_cost, warmup)
+        run(processes, make_scheduler(name, quantum), overhead)
+        avg_wt, avg_tat = averages(processes)
+        print(f"{name:<22}{avg_wt:>12.2f}{avg_tat:>12.2f}{overhead.switches:>10}"
+              f"{overhead.overhead:>10}{overhead.utilization:>10.1%}")
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="CPU Scheduling Simulator")
+    parser.add_argument("--batch", metavar="WORKLOAD",
+                        help="run headless on a workload file (pid,at,bt[,priority] per line)")
+    parser.add_argument("--algorithm", action="append", choices=list(ALGORITHMS),
+                        help="algorithm to run in batch mode (repeatable, default: all)")
+    parser.add_argument("--quantum", type=int, help="time quantum for round_robin (base quantum for mlfq)")
+    parser.add_argument("--switch-cost", type=int, default=0,
+                        help="time units charged per context switch in batch mode")
+    parser.add_argument("--warmup", type=int, default=0,
+                        help="extra work for a process after it is switched in (batch mode)")
+    args = parser.parse_args()
+
+    if args.batch:
+        needs = [name for name in args.algorithm or () if name in QUANTUM_ALGORITHMS]
+        if needs and args.quantum is None:
+            parser.error(f"{needs[0]} needs --quantum")
+        run_batch(args.batch, args.algorithm, args.quantum, args.switch_cost, args.warmup)
+    else:
+        main()
\ No newline at end of file
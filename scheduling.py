@@ -1,240 +1,162 @@
 # CPU Scheduling Algorithms Simulator
 # Algorithms: FCFS, SJF (Non-preemptive), Priority (Non-preemptive), Round Robin
 
-from collections import deque
+import argparse
+import asyncio
+import contextlib
+import sys
+import time
+from collections.abc import Iterable
 
-# Class to represent a process
-class Process:
-    def __init__(self, pid, at, bt, priority=0):
-        self.pid = pid           # Process ID
-        self.at = at             # Arrival Time
-        self.bt = bt             # Burst Time
-        self.priority = priority # Priority value 
-        self.wt = 0              # Waiting Time 
-        self.tat = 0             # Turnaround Time 
+from cpusched import (
+    Process, FCFS, SJF, SRTF, Priority, PriorityPreemptive, RoundRobin, run, run_table,
+    averages, ALGORITHMS, QUANTUM_ALGORITHMS, make_scheduler, stream, iter_workload, load_table,
+    LatencyStats, latency_stats, Probe, iter_processes, write_trace, convert,
+)
+from cpusched.workload import is_binary, is_sorted
+from cpusched.generate import add_arguments as add_generator_arguments, params_from
+from cpusched.output import (
+    TABLE_FORMATS, TIMELINE_FORMATS, LineWriter, GanttSample, Tee, TimelineWriter,
+    gantt_rows, write_table,
+)
 
-# Print results in table form after scheduling
-def print_table(processes, avg_wt, avg_tat):
-    print("\nProcess\tAT\tBT\tWT\tTAT")
-    for p in processes:
-        print(f"{p.pid}\t{p.at}\t{p.bt}\t{p.wt}\t{p.tat}")
+# Print results in table form after scheduling, followed by the latency
+# percentiles when a LatencyStats is given
+def print_table(processes, avg_wt, avg_tat, stats=None):
+    print()
+    write_table(processes)  # one write per few thousand rows
     print(f"Average WT = {avg_wt:.2f}")
     print(f"Average TAT = {avg_tat:.2f}")
+    if stats is not None:
+        print_percentiles(stats)
 
-# Print Gantt chart using timeline info
-def gantt_chart(timeline):
-    print("\nGantt Chart:")
-    # Top bar
-    for pid, s, f in timeline:
-        print(f"| {pid} ", end="")
-    print("|")
-    # Bottom 
-    for pid, s, f in timeline:
-        print(f"{s}".ljust(len(pid)+3), end="")
-    print(f"{timeline[-1][2]}")
+def print_percentiles(stats):
+    print()
+    for line in stats.format():
+        print(line)
 
-# ---------- FCFS ----------
-def fcfs(processes):
-    processes.sort(key=lambda x: x.at)  # Sort processes by arrival time
-    time, timeline = 0, []
-    for p in processes:
-        if time < p.at:  # idle until process arrives
-            time = p.at
-        start = time
-        p.wt = time - p.at
-        time += p.bt
-        finish = time
-        p.tat = p.wt + p.bt
-        timeline.append((p.pid, start, finish))
+# Print Gantt chart using timeline info; both rows are built first and
+# written at once. With max_segments only the start and end are shown.
+def gantt_chart(timeline, max_segments=None):
+    top, bottom = gantt_rows(timeline, max_segments)
+    sys.stdout.write(f"\nGantt Chart:\n{top}\n{bottom}\n")
 
-    avg_wt = sum(p.wt for p in processes) / len(processes)
-    avg_tat = sum(p.tat for p in processes) / len(processes)
+# Run a policy from the core library and print its results
+def report(processes, scheduler):
+    timeline = run(processes, scheduler)
+    avg_wt, avg_tat = averages(processes)
     gantt_chart(timeline)
-    print_table(processes, avg_wt, avg_tat)
+    print_table(processes, avg_wt, avg_tat, latency_stats(processes, timeline))
+
+# ---------- FCFS ----------
+def fcfs(processes):
+    report(processes, FCFS())
 
 # ---------- SJF (Non-preemptive) ----------
 def sjf(processes):
-    processes.sort(key=lambda x: (x.at, x.bt))
-    n, completed, time, timeline = len(processes), 0, 0, []
-    ready, done = [], [False] * n
-    
-    while completed < n:
-        # Collect processes that have arrived
-        for i, p in enumerate(processes):
-            if p.at <= time and not done[i] and (p.bt, i) not in ready:
-                ready.append((p.bt, i))
-        if ready:
-            ready.sort()   # Pick process with smallest burst time
-            bt, idx = ready.pop(0)
-            p = processes[idx]
-            start = time
-            p.wt = time - p.at
-            time += p.bt
-            finish = time
-            p.tat = p.wt + p.bt
-            done[idx] = True
-            completed += 1
-            timeline.append((p.pid, start, finish))
-        else:
-            time += 1  # No process available, idle
-
-    avg_wt = sum(p.wt for p in processes) / n
-    avg_tat = sum(p.tat for p in processes) / n
-    gantt_chart(timeline)
-    print_table(processes, avg_wt, avg_tat)
+    report(processes, SJF())
 
 # ---------- SJF (Preemptive: Shortest Remaining Time First) ----------
 def sjf_preemptive(processes):
-    n = len(processes)
-    time, completed = 0, 0
-    remaining = [p.bt for p in processes]  # track remaining burst times
-    timeline = []
-    last_pid, start_time = None, 0
-
-    while completed < n:
-        # Collect all arrived processes that are not finished
-        ready = [i for i, p in enumerate(processes) if p.at <= time and remaining[i] > 0]
-        if ready:
-            # Pick process with shortest remaining time
-            idx = min(ready, key=lambda i: remaining[i])
-            p = processes[idx]
-            if last_pid != p.pid:  # context switch
-                if last_pid is not None:
-                    timeline.append((last_pid, start_time, time))
-                start_time = time
-                last_pid = p.pid
-            remaining[idx] -= 1
-            time += 1
-            if remaining[idx] == 0:  # process completed
-                completed += 1
-                p.tat = time - p.at
-                p.wt = p.tat - p.bt
-        else:
-            time += 1  # CPU idle
-
-    timeline.append((last_pid, start_time, time))
-    avg_wt = sum(p.wt for p in processes) / n
-    avg_tat = sum(p.tat for p in processes) / n
-    gantt_chart(timeline)
-    print_table(processes, avg_wt, avg_tat)
+    report(processes, SRTF())
 
 # ---------- Priority (Non-preemptive) ----------
 def priority_scheduling(processes):
-    processes.sort(key=lambda x: (x.at, x.priority))
-    n, completed, time, timeline = len(processes), 0, 0, []
-    ready, done = [], [False] * n
-    
-    while completed < n:
-        # Collect processes that have arrived
-        for i, p in enumerate(processes):
-            if p.at <= time and not done[i] and (p.priority, i) not in ready:
-                ready.append((p.priority, i))
-        if ready:
-            ready.sort()   # Pick process with highest priority (lowest value)
-            pr, idx = ready.pop(0)
-            p = processes[idx]
-            start = time
-            p.wt = time - p.at
-            time += p.bt
-            finish = time
-            p.tat = p.wt + p.bt
-            done[idx] = True
-            completed += 1
-            timeline.append((p.pid, start, finish))
-        else:
-            time += 1  # No process available, idle
-
-    avg_wt = sum(p.wt for p in processes) / n
-    avg_tat = sum(p.tat for p in processes) / n
-    gantt_chart(timeline)
-    print_table(processes, avg_wt, avg_tat)
+    report(processes, Priority())
 
 # ---------- Priority (Preemptive) ----------
 def priority_preemptive(processes):
-    n = len(processes)
-    time, completed = 0, 0
-    remaining = [p.bt for p in processes]  # track remaining burst times
-    timeline = []
-    last_pid, start_time = None, 0
-
-    while completed < n:
-        # Collect all arrived processes that are not finished
-        ready = [i for i, p in enumerate(processes) if p.at <= time and remaining[i] > 0]
-        if ready:
-            # Pick process with highest priority (lowest priority value)
-            idx = min(ready, key=lambda i: processes[i].priority)
-            p = processes[idx]
-            if last_pid != p.pid:  # context switch
-                if last_pid is not None:
-                    timeline.append((last_pid, start_time, time))
-                start_time = time
-                last_pid = p.pid
-            remaining[idx] -= 1
-            time += 1
-            if remaining[idx] == 0:  # process completed
-                completed += 1
-                p.tat = time - p.at
-                p.wt = p.tat - p.bt
-        else:
-            time += 1  # CPU idle
-
-    timeline.append((last_pid, start_time, time))
-    avg_wt = sum(p.wt for p in processes) / n
-    avg_tat = sum(p.tat for p in processes) / n
-    gantt_chart(timeline)
-    print_table(processes, avg_wt, avg_tat)
+    report(processes, PriorityPreemptive())
 
 # ---------- Round Robin ----------
 def round_robin(processes, quantum):
-    n, time, timeline = len(processes), 0, []
-    queue = deque()
-    remaining_bt = [p.bt for p in processes]   # Track remaining burst times
-    completed, wt, tat = [False] * n, [0] * n, [0] * n
-    
-    processes.sort(key=lambda x: x.at)
-    i = 0
-    while i < n and processes[i].at <= time:
-        queue.append(i); i += 1
+    report(processes, RoundRobin(quantum))
 
-    while queue:
-        idx = queue.popleft()
-        p = processes[idx]
-        start = time
+# ---------- Trace replay ----------
+# A workload file that is not in arrival order cannot be streamed, so it is
+# loaded into a ProcessTable and run with run_table(), which sorts it. Slices
+# go to `timeline` with positions in the file as ids. Returns the processes
+# with WT/TAT set and their latency stats.
+def run_unsorted(path, scheduler, timeline=None, probe=None):
+    table = load_table(path)
+    result = run_table(table, scheduler, probe=probe)
+    if timeline is not None:
+        timeline.extend(zip(result.ids, result.starts, result.finishes))
+    processes = table.to_processes()
+    return processes, latency_stats(processes, result)
 
-        if remaining_bt[idx] > quantum:   # Process runs for quantum, not finished
-            time += quantum
-            remaining_bt[idx] -= quantum
-            finish = time
-        else:                             # Process finishes in this slice
-            time += remaining_bt[idx]
-            finish = time
-            tat[idx] = time - p.at
-            wt[idx] = tat[idx] - p.bt
-            remaining_bt[idx] = 0
-            completed[idx] = True
-        
-        timeline.append((p.pid, start, finish))
+# Stream a workload (a file, or any iterable of Processes sorted by arrival)
+# through a scheduler, writing each process as it completes. Nothing but the
+# engine's ready queue, the fixed-size latency sketches and the output
+# buffers stays in memory. A file out of arrival order goes through
+# run_unsorted() instead, and is held in memory whole.
+#   table: "text", "csv" or "jsonl" rows to `table_out` (default stdout), or
+#          None for the summary only
+#   timeline_out: also write every slice there, as CSV or binary
+#   gantt: print a Gantt chart of the first and last gantt // 2 slices; ids
+#          are positions in the trace (#1 is the first process)
+# The averages and percentiles go to stdout, or to stderr when stdout already
+# carries CSV/JSONL rows or the timeline. With a Probe, the engine's phases
+# are timed and "replay" covers the whole run, reading and writing included.
+def replay(path, name, quantum=None, probe=None, table="text", table_out=None,
+           timeline_out=None, timeline_format="csv", gantt=None):
+    scheduler = make_scheduler(name, quantum)
+    stats = LatencyStats()
+    t0 = time.perf_counter()
 
-        # Add newly arrived processes
-        while i < n and processes[i].at <= time:
-            queue.append(i); i += 1
-        if not completed[idx]:
-            queue.append(idx)  # Put back into queue if not finished
-        if not queue and i < n:  # If CPU idle, jump to next arrival
-            time = processes[i].at
-            queue.append(i); i += 1
-    
-    # Save calculated WT and TAT into objects
-    for j in range(n):
-        processes[j].wt, processes[j].tat = wt[j], tat[j]
-    
-    avg_wt = sum(wt) / n
-    avg_tat = sum(tat) / n
-    gantt_chart(timeline)
-    print_table(processes, avg_wt, avg_tat)
+    sinks = []
+    if timeline_out is not None:
+        writer = TimelineWriter(timeline_out, timeline_format)
+        sinks.append(writer)
+    if gantt:
+        sample = GanttSample(max(1, gantt // 2), lambda i: f"#{i + 1}")
+        sinks.append(sample)
+    timeline = sinks[0] if len(sinks) == 1 else Tee(*sinks) if sinks else None
 
-# ---------- MAIN ----------
-if __name__ == "__main__":
+    if isinstance(path, Iterable) and not isinstance(path, str):
+        completed = stream(path, scheduler, timeline, stats=stats, probe=probe)
+    elif is_sorted(path):
+        completed = stream(iter_workload(path), scheduler, timeline, stats=stats, probe=probe)
+    else:
+        completed, stats = run_unsorted(path, scheduler, timeline, probe)
+    if table is None:
+        for p in completed:
+            pass
+    else:
+        write_table(completed, table_out, table)
+    if timeline_out is not None:
+        writer.flush()
+    if probe is not None:
+        probe.add_time("replay", time.perf_counter() - t0)
+
+    machine = (table in ("csv", "jsonl") and table_out is None
+               or timeline_out in (sys.stdout, sys.stdout.buffer))
+    out = LineWriter(sys.stderr if machine else sys.stdout)
+    if gantt:
+        top, bottom = sample.rows()
+        out.write(f"\nGantt Chart ({sample.count} slices):\n{top}\n{bottom}")
+    if stats.n:
+        summary = stats.summary()
+        out.write(f"Average WT = {summary['avg_wt']:.2f}")
+        out.write(f"Average TAT = {summary['avg_tat']:.2f}")
+        out.write("")
+        for line in stats.format():
+            out.write(line)
+    out.flush()
+
+# Play the trace against the wall clock at `speed` time units per second,
+# printing each slice of the Gantt chart as it finishes
+def replay_live(path, name, quantum=None, speed=1.0):
+    from cpusched.replay import replay as replay_async, aiter_workload
+
+    async def play():
+        scheduler = make_scheduler(name, quantum)
+        async for pid, s, f in replay_async(aiter_workload(path), scheduler, speed):
+            print(f"{s}-{f}\t{pid}", flush=True)
+
+    asyncio.run(play())
+
+def interactive():
     print("Choose Algorithm:")
     print("1. FCFS")
     print("2. SJF (Non-preemptive)")
@@ -249,7 +171,7 @@ if __name__ == "__main__":
     for i in range(n):
         at = int(input(f"Enter Arrival Time of P{i+1}: "))
         bt = int(input(f"Enter Burst Time of P{i+1}: "))
-        if choice == 3:  # Priority scheduling needs priority input
+        if choice in (4, 5):  # Priority scheduling needs priority input
             priority = int(input(f"Enter Priority of P{i+1} (lower = higher priority): "))
         else:
             priority = 0
@@ -270,4 +192,85 @@ if __name__ == "__main__":
         quantum = int(input("Enter Quantum: "))
         round_robin(processes.copy(), quantum)
     else:
-        print("Invalid choice!")
\ No newline at end of file
+        print("Invalid choice!")
+
+# ---------- MAIN ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CPU Scheduling Algorithms Simulator")
+    parser.add_argument("workload", nargs="?",
+                        help="CSV or JSON Lines trace, optionally .gz, or a "
+                             "binary .cpt trace (prompts for input when omitted)")
+    parser.add_argument("--algorithm", choices=list(ALGORITHMS), default="fcfs")
+    parser.add_argument("--quantum", type=int, help="time quantum for round_robin (base quantum for mlfq)")
+    parser.add_argument("--speed", type=float,
+                        help="replay in real time at this many time units per second")
+    parser.add_argument("--format", choices=TABLE_FORMATS, default="text",
+                        help="per-process table format")
+    parser.add_argument("--output", metavar="FILE", help="write the table here (default: stdout)")
+    parser.add_argument("--summary", action="store_true",
+                        help="print only the averages and percentiles, no table")
+    parser.add_argument("--timeline", metavar="FILE",
+                        help="write every slice here ('-' for stdout)")
+    parser.add_argument("--timeline-format", choices=TIMELINE_FORMATS, default="csv")
+    parser.add_argument("--gantt", type=int, metavar="N",
+                        help="print a Gantt chart of the first and last N/2 slices")
+    parser.add_argument("--generate", type=int, metavar="N",
+                        help="replay N generated jobs instead of a workload file")
+    parser.add_argument("--save", metavar="FILE",
+                        help="instead of replaying, write the generated jobs to this trace "
+                             "(.cpt binary, or .csv/.jsonl, optionally .gz) or convert the "
+                             "workload to this binary .cpt trace")
+    add_generator_arguments(parser.add_argument_group("generator options (with --generate)"))
+    parser.add_argument("--profile", metavar="FILE",
+                        help="instrument the run and write a report: pstats for .prof, "
+                             "JSON otherwise")
+    args = parser.parse_args()
+
+    source = args.workload
+    if args.generate is not None:
+        if args.workload is not None:
+            parser.error("give a workload file or --generate, not both")
+        try:
+            source = iter_processes(args.generate, **params_from(args))
+        except ValueError as exc:
+            parser.error(str(exc))
+    elif args.save and args.workload is None:
+        parser.error("--save needs a workload or --generate")
+    elif args.save and not is_binary(args.save):
+        parser.error("workloads are converted to binary .cpt traces only")
+    if args.timeline == "-" and not (args.summary or args.output):
+        parser.error("--timeline - needs --summary or --output to keep the table off stdout")
+
+    if args.save and args.generate is not None:
+        write_trace(args.save, args.generate, **params_from(args))
+    elif args.save:
+        convert(args.workload, args.save)
+    elif source is None:
+        interactive()
+    elif args.algorithm in QUANTUM_ALGORITHMS and args.quantum is None:
+        parser.error(f"{args.algorithm} needs --quantum")
+    elif args.speed is not None:
+        if args.generate is not None:
+            parser.error("--speed replays workload files only")
+        if not is_sorted(args.workload):
+            parser.error("--speed needs a workload sorted by arrival time")
+        replay_live(args.workload, args.algorithm, args.quantum, args.speed)
+    else:
+        probe = Probe() if args.profile else None
+        with contextlib.ExitStack() as files:
+            table_out = timeline_out = None
+            if args.output:
+                table_out = files.enter_context(open(args.output, "w"))
+            if args.timeline == "-":
+                timeline_out = sys.stdout.buffer if args.timeline_format == "binary" else sys.stdout
+            elif args.timeline:
+                mode = "wb" if args.timeline_format == "binary" else "w"
+                timeline_out = files.enter_context(open(args.timeline, mode))
+            replay(source, args.algorithm, args.quantum, probe,
+                   None if args.summary else args.format, table_out,
+                   timeline_out, args.timeline_format, args.gantt)
+        if probe is not None:
+            if args.profile.endswith(".prof"):
+                probe.dump_stats(args.profile)
+            else:
+                probe.write_json(args.profile)
@@ -0,0 +1,91 @@
+# Result cache: copies on hits, the disk tier, eviction, damaged files and
+# policy keys
+
+import os
+
+from cpusched import FCFS, MLFQ, Process, RoundRobin, SRTF, ResultCache, run, simulate
+from cpusched.cache import policy_key
+
+AT, BT, PRIORITY = [0, 2, 4, 6, 8], [5, 3, 8, 2, 4], [1, 2, 3, 1, 2]
+
+def files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".bin"))
+
+def test_hit_returns_copies():
+    cache = ResultCache()
+    wt, tat, timeline = cache.simulate(AT, BT, PRIORITY, RoundRobin(2))
+    expected = (list(wt), list(tat), list(timeline))
+    wt[0] = tat[0] = -1
+    timeline.ids[0] = timeline.starts[0] = -1
+
+    wt, tat, timeline = cache.simulate(AT, BT, PRIORITY, RoundRobin(2))
+    assert (list(wt), list(tat), list(timeline)) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert expected[:2] == simulate(AT, BT, PRIORITY, RoundRobin(2))[:2]
+
+def test_run_matches_engine():
+    cache = ResultCache()
+    for _ in range(2):
+        processes = [Process(f"P{i + 1}", a, b, p)
+                     for i, (a, b, p) in enumerate(zip(AT, BT, PRIORITY))]
+        timeline = cache.run(processes, SRTF())
+        expected = [Process(p.pid, p.at, p.bt, p.priority) for p in processes]
+        assert list(timeline) == list(run(expected, SRTF()))
+        assert [(p.wt, p.tat) for p in processes] == [(p.wt, p.tat) for p in expected]
+
+def test_disk_tier_is_shared(tmp_path):
+    first = ResultCache(directory=tmp_path)
+    result = first.simulate(AT, BT, PRIORITY, SRTF())
+    assert len(files(tmp_path)) == 1
+
+    fresh = ResultCache(directory=tmp_path)
+    again = fresh.simulate(AT, BT, PRIORITY, SRTF())
+    assert (fresh.hits, fresh.misses) == (1, 0)
+    assert [list(c) for c in again[:2]] == [list(c) for c in result[:2]]
+    assert list(again[2]) == list(result[2])
+
+def test_eviction_down_to_max_bytes(tmp_path):
+    cache = ResultCache(directory=tmp_path)
+    for q in (1, 2, 3):
+        cache.simulate(AT, BT, PRIORITY, MLFQ((q, None)))
+    names = files(tmp_path)
+    size = os.path.getsize(tmp_path / names[0])
+    # oldest first: MLFQ-1, MLFQ-2, MLFQ-3
+    for t, q in enumerate((1, 2, 3), 1):
+        (name,) = [n for n in names if n.endswith(f"-{policy_key(MLFQ((q, None)))}.bin")]
+        os.utime(tmp_path / name, (t, t))
+
+    cache.max_bytes = 2 * size
+    cache.simulate(AT, BT, PRIORITY, MLFQ((4, None)))
+    left = files(tmp_path)
+    assert sum(os.path.getsize(tmp_path / name) for name in left) <= cache.max_bytes
+    assert [name.split("-", 1)[1] for name in left] == \
+        sorted(policy_key(MLFQ((q, None))) + ".bin" for q in (3, 4))
+
+def test_damaged_file_is_removed(tmp_path):
+    ResultCache(directory=tmp_path).simulate(AT, BT, PRIORITY, FCFS())
+    (name,) = files(tmp_path)
+    path = tmp_path / name
+    path.write_bytes(path.read_bytes()[:-8])
+
+    cache = ResultCache(directory=tmp_path)
+    assert cache.get(name[:-len(".bin")]) is None
+    assert not path.exists()
+    wt, tat, _ = cache.simulate(AT, BT, PRIORITY, FCFS())
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert list(wt) == simulate(AT, BT, PRIORITY, FCFS())[0]
+    # the damaged file was dropped and the recomputed result written in its place
+    fresh = ResultCache(directory=tmp_path)
+    fresh.simulate(AT, BT, PRIORITY, FCFS())
+    assert (fresh.hits, fresh.misses) == (1, 0)
+
+def test_policy_keys():
+    configs = [MLFQ(), MLFQ((2, 4, 8)), MLFQ((2, 4, None)), MLFQ((2, 4, 8), boost=50),
+               MLFQ((2, 4, 8), aging=20), MLFQ((2, 4, 8), boost=50, aging=20)]
+    keys = [policy_key(s) for s in configs]
+    assert len(set(keys)) == len(keys)
+    for scheduler, key in zip(configs, keys):
+        simulate(AT, BT, PRIORITY, scheduler)
+        assert policy_key(scheduler) == key
+    assert policy_key(RoundRobin(2)) != policy_key(RoundRobin(3))
+    assert policy_key(RoundRobin(2)) == policy_key(RoundRobin(2, fast_forward=False))
@@ -0,0 +1,29 @@
+# Generator parameters are checked when the generator is created, before any
+# job is drawn
+
+import pytest
+
+from cpusched import generate, iter_processes, write_trace
+
+@pytest.mark.parametrize("params", [
+    {"arrivals": "mmpp", "dwell": 0},
+    {"arrivals": "mmpp", "burstiness": 0},
+    {"bursts": "lognormal", "sigma": 0},
+    {"bursts": "pareto", "shape": 1},
+    {"utilization": 0},
+    {"max_burst": 0},
+    {"correlation": 2},
+])
+def test_bad_parameters(params, tmp_path):
+    with pytest.raises(ValueError):
+        iter_processes(10, **params)
+    with pytest.raises(ValueError):
+        generate(10, **params)
+    with pytest.raises(ValueError):
+        write_trace(tmp_path / "w.csv", 10, **params)
+    assert not (tmp_path / "w.csv").exists()
+
+def test_poisson_ignores_mmpp_settings():
+    table = generate(100, seed=1, burstiness=0, dwell=0)
+    assert len(table) == 100
+    assert list(table.at) == sorted(table.at)
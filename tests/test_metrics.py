@@ -0,0 +1,41 @@
+# Latency percentiles: exact nearest-rank values from latency_stats(), and
+# the streaming sketch within its relative accuracy
+
+import math
+import random
+
+from cpusched import LatencyStats, Process, RoundRobin, latency_stats, run, stream
+
+def nearest_rank(values, q):
+    values = sorted(values)
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+def workload(rng, n):
+    at = sorted(rng.randint(0, 500) for _ in range(n))
+    return [Process(f"P{i + 1}", a, rng.randint(1, 40)) for i, a in enumerate(at)]
+
+def test_latency_stats_is_exact():
+    processes = [Process(f"P{i + 1}", 0, 5) for i in range(3)]
+    timeline = run(processes, RoundRobin(1))
+    response = latency_stats(processes, timeline).summary()["response"]
+    assert (response["p50"], response["p95"], response["p99"], response["max"]) == (1, 2, 2, 2)
+
+    rng = random.Random(1)
+    for _ in range(50):
+        processes = workload(rng, rng.randint(1, 200))
+        summary = latency_stats(processes, run(processes, RoundRobin(3))).summary()
+        wt = [p.wt for p in processes]
+        for q in (0.5, 0.95, 0.99):
+            assert summary["wt"][f"p{round(q * 100)}"] == nearest_rank(wt, q)
+        assert summary["wt"]["max"] == max(wt)
+
+def test_streamed_sketch_within_accuracy():
+    rng = random.Random(2)
+    processes = workload(rng, 2000)
+    stats = LatencyStats(accuracy=0.01)
+    done = list(stream(processes, RoundRobin(3), stats=stats))
+    wt = [p.wt for p in done]
+    summary = stats.summary()
+    for q in (0.5, 0.95, 0.99):
+        exact = nearest_rank(wt, q)
+        assert abs(summary["wt"][f"p{round(q * 100)}"] - exact) <= 0.01 * exact + 1e-9
@@ -0,0 +1,82 @@
+# Multilevel feedback queue: level allotments, CPU time per process, and the
+# streamed and online drivers against simulate(), on seeded random workloads
+
+import random
+from itertools import accumulate
+
+import pytest
+
+from cpusched import MLFQ, OnlineScheduler, Process, simulate, stream
+
+SETTINGS = [
+    {},
+    {"quanta": (2, 4, None)},
+    {"quanta": (1, 3), "boost": 20},
+    {"quanta": (2, 4, 8), "aging": 15},
+    {"quanta": (2, 5, 10), "boost": 30, "aging": 10},
+]
+
+# Sorted by arrival, so stream() and OnlineScheduler number them in list order
+def workload(rng):
+    n = rng.randint(1, 25)
+    at = sorted(rng.randint(0, 60) for _ in range(n))
+    bt = [rng.randint(1, 30) for _ in range(n)]
+    return at, bt
+
+def processes(at, bt):
+    return [Process(f"P{i + 1}", a, b) for i, (a, b) in enumerate(zip(at, bt))]
+
+# Each process's slices in time order, with the CPU time it had used before each
+def usage(timeline):
+    used, out = {}, []
+    for i, s, f in timeline:
+        out.append((i, used.get(i, 0), f - s))
+        used[i] = used.get(i, 0) + f - s
+    return used, out
+
+def test_slices_stay_within_their_level():
+    rng = random.Random(1)
+    for quanta in [(1, 2, 4), (3, 6, None), (2, 2)]:
+        # a process demoted from level k has used the first k allotments
+        bounds = list(accumulate(q for q in quanta if q is not None))
+        for _ in range(200):
+            at, bt = workload(rng)
+            _, _, timeline = simulate(at, bt, [0] * len(at), MLFQ(quanta), timeline=[])
+            for i, before, ran in usage(timeline)[1]:
+                assert not any(before < b < before + ran for b in bounds)
+
+@pytest.mark.parametrize("settings", SETTINGS)
+def test_every_process_gets_its_burst(settings):
+    rng = random.Random(2)
+    for _ in range(200):
+        at, bt = workload(rng)
+        _, _, timeline = simulate(at, bt, [0] * len(at), MLFQ(**settings), timeline=[])
+        used, _ = usage(timeline)
+        assert used == dict(enumerate(bt))
+
+@pytest.mark.parametrize("settings", SETTINGS)
+def test_stream_and_online_match_simulate(settings):
+    rng = random.Random(3)
+    for _ in range(200):
+        at, bt = workload(rng)
+        wt, tat, _ = simulate(at, bt, [0] * len(at), MLFQ(**settings))
+        expected = {f"P{i + 1}": (w, t) for i, (w, t) in enumerate(zip(wt, tat))}
+
+        streamed = {p.pid: (p.wt, p.tat) for p in stream(processes(at, bt), MLFQ(**settings))}
+        assert streamed == expected
+
+        online = OnlineScheduler(MLFQ(**settings))
+        for p in processes(at, bt):
+            online.submit(p)
+        assert {p.pid: (p.wt, p.tat) for p in online.drain()} == expected
+
+@pytest.mark.parametrize("settings", SETTINGS)
+def test_streamed_run_leaves_no_state(settings):
+    rng = random.Random(4)
+    for _ in range(50):
+        at, bt = workload(rng)
+        scheduler = MLFQ(**settings)
+        for _ in stream(processes(at, bt), scheduler):
+            pass
+        assert not scheduler.level and not scheduler.used and not scheduler.left
+        assert len(scheduler) == 0
@@ -0,0 +1,97 @@
+# Multi-CPU simulation: one CPU against the single-CPU engine, and the
+# invariants of a schedule on several CPUs, on seeded random workloads
+
+import random
+
+import pytest
+
+from cpusched import FCFS, SJF, SRTF, Priority, PriorityPreemptive, RoundRobin, simulate, \
+    simulate_multicore
+
+POLICIES = [FCFS, SJF, SRTF, Priority, PriorityPreemptive,
+            lambda: RoundRobin(1), lambda: RoundRobin(3)]
+
+def workload(rng):
+    n = rng.randint(1, 30)
+    at = [rng.randint(0, 40) for _ in range(n)]
+    bt = [rng.randint(1, 9) for _ in range(n)]
+    priority = [rng.randint(1, 4) for _ in range(n)]
+    return at, bt, priority
+
+# (process, start, finish) slices of every CPU, with the CPU number
+def slices(result):
+    return [(c, i, s, f) for c, timeline in enumerate(result.timelines)
+            for i, s, f in timeline if f > s]
+
+# Elementary intervals between consecutive slice boundaries and arrivals,
+# with the processes running and ready (arrived, unfinished, not running)
+# during each
+def intervals(at, result):
+    done = [a + t for a, t in zip(at, result.tat)]
+    runs = slices(result)
+    points = sorted({s for _, _, s, _ in runs} | {f for _, _, _, f in runs} | set(at))
+    for t0, t1 in zip(points, points[1:]):
+        running = {i for _, i, s, f in runs if s <= t0 and f >= t1}
+        ready = [i for i in range(len(at)) if at[i] <= t0 and done[i] >= t1 and i not in running]
+        yield running, ready
+
+@pytest.mark.parametrize("per_cpu", [False, True])
+@pytest.mark.parametrize("policy", POLICIES)
+def test_one_cpu_matches_engine(policy, per_cpu):
+    rng = random.Random(1)
+    for _ in range(200):
+        at, bt, priority = workload(rng)
+        wt, tat, timeline = simulate(at, bt, priority, policy())
+        result = simulate_multicore(at, bt, priority, policy(), 1, per_cpu)
+        assert result.wt == wt
+        assert result.tat == tat
+        assert list(result.timelines[0]) == list(timeline)
+
+@pytest.mark.parametrize("per_cpu", [False, True])
+@pytest.mark.parametrize("policy", POLICIES)
+def test_every_process_gets_its_burst_on_one_cpu_at_a_time(policy, per_cpu):
+    rng = random.Random(2)
+    for _ in range(200):
+        at, bt, priority = workload(rng)
+        cpus = rng.randint(2, 4)
+        result = simulate_multicore(at, bt, priority, policy(), cpus, per_cpu)
+        runs = {}
+        for _, i, s, f in slices(result):
+            assert s >= at[i]
+            runs.setdefault(i, []).append((s, f))
+        for i, spans in runs.items():
+            spans.sort()
+            assert sum(f - s for s, f in spans) == bt[i]
+            assert all(f <= s for (_, f), (s, _) in zip(spans, spans[1:]))
+            assert spans[-1][1] == at[i] + result.tat[i]
+        assert sorted(runs) == list(range(len(at)))
+        assert sum(result.busy) == sum(bt)
+
+# Per-CPU queues only manage this through work stealing
+@pytest.mark.parametrize("per_cpu", [False, True])
+@pytest.mark.parametrize("policy", POLICIES)
+def test_no_cpu_idle_while_work_is_ready(policy, per_cpu):
+    rng = random.Random(3)
+    for _ in range(200):
+        at, bt, priority = workload(rng)
+        cpus = rng.randint(2, 4)
+        result = simulate_multicore(at, bt, priority, policy(), cpus, per_cpu)
+        for running, ready in intervals(at, result):
+            assert len(running) == cpus or not ready
+
+def test_global_priority_preemption():
+    rng = random.Random(4)
+    for _ in range(200):
+        at, bt, priority = workload(rng)
+        result = simulate_multicore(at, bt, priority, PriorityPreemptive(), 3)
+        for running, ready in intervals(at, result):
+            if running and ready:
+                assert max(priority[i] for i in running) <= min(priority[i] for i in ready)
+
+def test_per_cpu_steals_from_the_longest_queue():
+    # arrivals alternate between the CPUs; CPU 1 gets the short jobs, runs out
+    # of work first and takes the long ones queued on CPU 0
+    at, bt = [0] * 6, [10, 1, 10, 1, 10, 1]
+    result = simulate_multicore(at, bt, [0] * 6, FCFS(), 2, per_cpu=True)
+    assert [i for i, _, _ in result.timelines[1]] == [1, 3, 5, 2]
+    assert result.finish == 20
@@ -0,0 +1,137 @@
+# Bulk output: streamed timeline sinks against run_table(), table formats, the
+# binary timeline round trip, and the CLI text output against the original
+# print-based functions
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import scheduling
+from cpusched import ALGORITHMS, Process, generate, make_scheduler, run_table, stream
+from cpusched.output import (
+    GanttSample, Tee, TimelineWriter, gantt_rows, read_timeline, write_table, write_timeline,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# A generated trace is in arrival order, so streamed arrival numbers are the
+# same ids as run_table()'s row indices
+@pytest.fixture(scope="module")
+def table():
+    return generate(400, seed=7, mean_burst=6)
+
+def slices(timeline):
+    return list(zip(timeline.ids, timeline.starts, timeline.finishes))
+
+@pytest.mark.parametrize("name", list(ALGORITHMS))
+def test_streamed_sinks_match_run_table(name, table, tmp_path):
+    expected = run_table(table, make_scheduler(name, 2))
+
+    out = io.StringIO()
+    csv = TimelineWriter(out)
+    with open(tmp_path / "t.bin", "wb") as f:
+        binary = TimelineWriter(f, "binary", chunk=64)
+        sample = GanttSample(5, lambda i: f"#{i + 1}")
+        for _ in stream(table.to_processes(), make_scheduler(name, 2), Tee(csv, binary, sample)):
+            pass
+        csv.flush()
+        binary.flush()
+
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "id,start,finish"
+    assert [tuple(map(int, line.split(","))) for line in lines[1:]] == slices(expected)
+    assert slices(read_timeline(tmp_path / "t.bin")) == slices(expected)
+
+    expected.labels = lambda i: f"#{i + 1}"
+    assert sample.rows() == gantt_rows(expected, 10)
+    assert csv.count == binary.count == sample.count == len(expected)
+
+def test_unmerged_sinks_keep_every_slice(table):
+    raw = []
+    writer = TimelineWriter(io.StringIO(), merge=False)
+    for _ in stream(table.to_processes(), make_scheduler("round_robin", 1), Tee(raw, writer)):
+        pass
+    writer.flush()
+    assert writer.count == len(raw)
+    assert writer.count > len(run_table(table, make_scheduler("round_robin", 1)))
+
+def test_binary_round_trip(table, tmp_path):
+    timeline = run_table(table, make_scheduler("sjf_preemptive"))
+    with open(tmp_path / "t.bin", "wb") as f:
+        write_timeline(timeline, f, "binary")
+    assert slices(read_timeline(tmp_path / "t.bin")) == slices(timeline)
+
+    (tmp_path / "bad.bin").write_bytes(b"CPTL" + bytes(20))
+    with pytest.raises(ValueError):
+        read_timeline(tmp_path / "bad.bin")
+
+def test_table_formats():
+    processes = [Process("P1", 0, 5), Process("P2", 1, 3)]
+    processes[0].wt, processes[0].tat = 0, 5
+    processes[1].wt, processes[1].tat = 4, 7
+    out = {}
+    for fmt in ("text", "csv", "jsonl"):
+        buf = io.StringIO()
+        write_table(processes, buf, fmt)
+        out[fmt] = buf.getvalue().splitlines()
+    assert out["text"] == ["Process\tAT\tBT\tWT\tTAT", "P1\t0\t5\t0\t5", "P2\t1\t3\t4\t7"]
+    assert out["csv"] == ["pid,at,bt,wt,tat", "P1,0,5,0,5", "P2,1,3,4,7"]
+    assert [json.loads(line) for line in out["jsonl"]] == [
+        {"pid": "P1", "at": 0, "bt": 5, "wt": 0, "tat": 5},
+        {"pid": "P2", "at": 1, "bt": 3, "wt": 4, "tat": 7},
+    ]
+    with pytest.raises(ValueError):
+        write_table(processes, io.StringIO(), "xml")
+
+# ---------- The original print-based output ----------
+
+def original_print_table(processes, avg_wt, avg_tat):
+    print("\nProcess\tAT\tBT\tWT\tTAT")
+    for p in processes:
+        print(f"{p.pid}\t{p.at}\t{p.bt}\t{p.wt}\t{p.tat}")
+    print(f"Average WT = {avg_wt:.2f}")
+    print(f"Average TAT = {avg_tat:.2f}")
+
+def original_gantt_chart(timeline):
+    print("\nGantt Chart:")
+    for pid, s, f in timeline:
+        print(f"| {pid} ", end="")
+    print("|")
+    for pid, s, f in timeline:
+        print(f"{s}".ljust(len(pid)+3), end="")
+    print(f"{timeline[-1][2]}")
+
+def test_text_output_is_byte_identical(table, capsys):
+    processes = table.to_processes()
+    timeline = run_table(table, make_scheduler("round_robin", 3))
+    for p, w, t in zip(processes, table.wt, table.tat):
+        p.wt, p.tat = w, t
+
+    scheduling.gantt_chart(timeline)
+    scheduling.print_table(processes, 1.5, 2.25)
+    new = capsys.readouterr().out
+    original_gantt_chart(list(timeline))
+    original_print_table(processes, 1.5, 2.25)
+    assert new == capsys.readouterr().out
+
+# ---------- --timeline - ----------
+
+def cli(*args):
+    return subprocess.run([sys.executable, "scheduling.py", *args], cwd=ROOT,
+                          capture_output=True, text=True)
+
+def test_timeline_to_stdout_needs_the_table_elsewhere():
+    args = ["--generate", "200", "--seed", "1", "--algorithm", "round_robin", "--quantum", "2",
+            "--timeline", "-"]
+    assert cli(*args).returncode == 2
+
+    result = cli(*args, "--summary")
+    assert result.returncode == 0
+    lines = result.stdout.splitlines()
+    assert lines[0] == "id,start,finish"
+    assert all(len(line.split(",")) == 3 for line in lines[1:])
+    assert "Average WT" in result.stderr
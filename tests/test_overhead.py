@@ -0,0 +1,43 @@
+# Context-switch costs: busy time and slice totals account for every switch,
+# and round-robin fast-forward (turned off by the engine when switches cost
+# time) gives the same counts and results as slice-by-slice
+
+import random
+
+import pytest
+
+from cpusched import ALGORITHMS, ContextSwitch, RoundRobin, make_scheduler, simulate
+
+def workload(rng):
+    n = rng.randint(1, 20)
+    at = [rng.randint(0, 50) for _ in range(n)]
+    bt = [rng.randint(1, 30) for _ in range(n)]
+    priority = [rng.randint(1, 4) for _ in range(n)]
+    return at, bt, priority
+
+@pytest.mark.parametrize("cost, warmup", [(1, 0), (0, 2), (2, 3)])
+@pytest.mark.parametrize("name", list(ALGORITHMS))
+def test_busy_time_and_slices(name, cost, warmup):
+    rng = random.Random(1)
+    for _ in range(100):
+        at, bt, priority = workload(rng)
+        overhead = ContextSwitch(cost, warmup)
+        _, _, timeline = simulate(at, bt, priority, make_scheduler(name, 3), overhead=overhead)
+        assert overhead.switches >= 1
+        assert overhead.overhead == overhead.switches * (cost + warmup)
+        assert overhead.busy == sum(bt) + overhead.switches * (cost + warmup)
+        assert sum(f - s for _, s, f in timeline) == sum(bt) + overhead.switches * warmup
+        assert 0 < overhead.utilization <= 1
+
+@pytest.mark.parametrize("cost, warmup", [(0, 0), (1, 2)])
+@pytest.mark.parametrize("quantum", [1, 2, 5])
+def test_fast_forward_counts_the_same_switches(quantum, cost, warmup):
+    rng = random.Random(quantum)
+    for _ in range(200):
+        at, bt, priority = workload(rng)
+        counts = []
+        for fast_forward in (True, False):
+            overhead = ContextSwitch(cost, warmup)
+            result = simulate(at, bt, priority, RoundRobin(quantum, fast_forward), overhead=overhead)
+            counts.append((overhead.switches, overhead.busy, result[:2]))
+        assert counts[0] == counts[1]
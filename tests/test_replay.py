@@ -0,0 +1,26 @@
+# Asyncio replay: at infinite speed, replays gathered in one event loop take
+# turns instead of running one after the other
+
+import asyncio
+
+from cpusched import Process, RoundRobin
+from cpusched.replay import replay
+
+async def arrivals(n):
+    for i in range(n):
+        yield Process(f"P{i + 1}", i, 5)
+
+def test_replays_share_the_event_loop():
+    order = []
+
+    async def play(name):
+        async for _ in replay(arrivals(200), RoundRobin(1), speed=float("inf")):
+            order.append(name)
+
+    async def main():
+        await asyncio.gather(play("a"), play("b"))
+
+    asyncio.run(main())
+    switches = sum(x != y for x, y in zip(order, order[1:]))
+    assert order.count("a") == order.count("b") > 100
+    assert switches > len(order) // 4
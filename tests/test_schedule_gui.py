@@ -0,0 +1,32 @@
+# Import cost of schedule_gui: headless use must not load the GUI toolkit or
+# NumPy, and a cold import has to stay within a time budget
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+IMPORT_BUDGET = 0.3  # seconds; about 0.07 on a typical machine
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import schedule_gui
+elapsed = time.perf_counter() - t0
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+def cold_import():
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out)
+
+def test_import_is_headless():
+    modules = set(cold_import()["modules"])
+    assert not {"tkinter", "customtkinter", "numpy"} & modules
+
+def test_import_time():
+    # best of three, so one slow start on a busy machine does not fail it
+    seconds = min(cold_import()["seconds"] for _ in range(3))
+    assert seconds < IMPORT_BUDGET, f"import schedule_gui took {seconds:.3f}s"
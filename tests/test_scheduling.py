@@ -0,0 +1,205 @@
+# The event-driven and heap-based schedulers against the original
+# tick-by-tick implementations, on seeded random workloads
+
+import io
+import random
+from collections import deque
+
+import pytest
+
+import scheduling
+from cpusched import (
+    Process, SJF, SRTF, Priority, PriorityPreemptive, RoundRobin, run,
+)
+
+# ---------- Reference: the original scheduling.py loops ----------
+# Same selection logic as before the heap rewrite; they return the timeline
+# instead of printing it.
+
+def reference_sjf(processes):
+    processes.sort(key=lambda x: (x.at, x.bt))
+    n, completed, time, timeline = len(processes), 0, 0, []
+    ready, done = [], [False] * n
+    while completed < n:
+        for i, p in enumerate(processes):
+            if p.at <= time and not done[i] and (p.bt, i) not in ready:
+                ready.append((p.bt, i))
+        if ready:
+            ready.sort()
+            bt, idx = ready.pop(0)
+            p = processes[idx]
+            start = time
+            p.wt = time - p.at
+            time += p.bt
+            p.tat = p.wt + p.bt
+            done[idx] = True
+            completed += 1
+            timeline.append((p.pid, start, time))
+        else:
+            time += 1
+    return timeline
+
+def reference_priority(processes):
+    processes.sort(key=lambda x: (x.at, x.priority))
+    n, completed, time, timeline = len(processes), 0, 0, []
+    ready, done = [], [False] * n
+    while completed < n:
+        for i, p in enumerate(processes):
+            if p.at <= time and not done[i] and (p.priority, i) not in ready:
+                ready.append((p.priority, i))
+        if ready:
+            ready.sort()
+            pr, idx = ready.pop(0)
+            p = processes[idx]
+            start = time
+            p.wt = time - p.at
+            time += p.bt
+            p.tat = p.wt + p.bt
+            done[idx] = True
+            completed += 1
+            timeline.append((p.pid, start, time))
+        else:
+            time += 1
+    return timeline
+
+# The original preemptive loop, picking the ready process with the smallest
+# key(process, remaining) each tick. Unlike the original, a segment ends when
+# its process stops running rather than at the next dispatch, so idle time is
+# not shown as part of the segment before it.
+def reference_preemptive(processes, key):
+    n = len(processes)
+    time, completed = 0, 0
+    remaining = [p.bt for p in processes]
+    timeline = []
+    last_pid, start_time = None, 0
+    while completed < n:
+        ready = [i for i, p in enumerate(processes) if p.at <= time and remaining[i] > 0]
+        if ready:
+            idx = min(ready, key=lambda i: key(processes[i], remaining[i]))
+            p = processes[idx]
+            if last_pid != p.pid or timeline[-1][2] != time:  # context switch or idle gap
+                start_time = time
+                last_pid = p.pid
+                timeline.append((p.pid, start_time, time))
+            remaining[idx] -= 1
+            time += 1
+            timeline[-1] = (p.pid, start_time, time)
+            if remaining[idx] == 0:
+                completed += 1
+                p.tat = time - p.at
+                p.wt = p.tat - p.bt
+        else:
+            time += 1
+    return timeline
+
+def reference_srtf(processes):
+    return reference_preemptive(processes, lambda p, remaining: remaining)
+
+def reference_priority_preemptive(processes):
+    return reference_preemptive(processes, lambda p, remaining: p.priority)
+
+# The original round robin loop, except that remaining burst times are taken
+# after sorting and the CPU also idles until the first arrival (the original
+# indexed them before the sort and stopped when nothing arrived at time 0).
+# Back-to-back slices of one process are joined, as the Gantt chart shows them.
+def reference_round_robin(processes, quantum):
+    processes.sort(key=lambda x: x.at)
+    n, time, timeline = len(processes), 0, []
+    queue = deque()
+    remaining_bt = [p.bt for p in processes]
+    completed = [False] * n
+    i = 0
+    while i < n and processes[i].at <= time:
+        queue.append(i); i += 1
+    if not queue:
+        time = processes[0].at
+        queue.append(0); i = 1
+    while queue:
+        idx = queue.popleft()
+        p = processes[idx]
+        start = time
+        if remaining_bt[idx] > quantum:
+            time += quantum
+            remaining_bt[idx] -= quantum
+        else:
+            time += remaining_bt[idx]
+            p.tat = time - p.at
+            p.wt = p.tat - p.bt
+            remaining_bt[idx] = 0
+            completed[idx] = True
+        if timeline and timeline[-1][0] == p.pid and timeline[-1][2] == start:
+            timeline[-1] = (p.pid, timeline[-1][1], time)
+        else:
+            timeline.append((p.pid, start, time))
+        while i < n and processes[i].at <= time:
+            queue.append(i); i += 1
+        if not completed[idx]:
+            queue.append(idx)
+        if not queue and i < n:
+            time = processes[i].at
+            queue.append(i); i += 1
+    return timeline
+
+def reference_gantt(timeline):
+    top = "".join(f"| {pid} " for pid, s, f in timeline) + "|"
+    bottom = "".join(f"{s}".ljust(len(pid) + 3) for pid, s, f in timeline)
+    return f"Gantt Chart:\n{top}\n{bottom}{timeline[-1][2]}\n"
+
+# Small workloads with many ties and idle gaps, listed out of arrival order
+def workload(rng):
+    n = rng.randint(1, 12)
+    return [Process(f"P{i + 1}", rng.randint(0, 30), rng.randint(1, 8), rng.randint(1, 4))
+            for i in range(n)]
+
+@pytest.mark.parametrize("new, policy, reference", [
+    (scheduling.sjf, SJF, reference_sjf),
+    (scheduling.sjf_preemptive, SRTF, reference_srtf),
+    (scheduling.priority_scheduling, Priority, reference_priority),
+    (scheduling.priority_preemptive, PriorityPreemptive, reference_priority_preemptive),
+])
+def test_matches_reference(new, policy, reference, capsys):
+    rng = random.Random(2024)
+    for _ in range(300):
+        processes = workload(rng)
+        expected = [Process(p.pid, p.at, p.bt, p.priority) for p in processes]
+        timeline = reference(expected)
+        copies = [Process(p.pid, p.at, p.bt, p.priority) for p in processes]
+        assert list(run(copies, policy())) == timeline
+
+        new(processes)
+        out = capsys.readouterr().out
+        assert reference_gantt(timeline) in out
+        assert {p.pid: (p.wt, p.tat) for p in processes} == \
+            {p.pid: (p.wt, p.tat) for p in expected}
+
+@pytest.mark.parametrize("quantum", [1, 2, 3, 5])
+def test_round_robin_matches_reference(quantum, capsys):
+    rng = random.Random(quantum)
+    for _ in range(300):
+        processes = workload(rng)
+        expected = [Process(p.pid, p.at, p.bt, p.priority) for p in processes]
+        timeline = reference_round_robin(expected, quantum)
+        copies = [Process(p.pid, p.at, p.bt, p.priority) for p in processes]
+        assert list(run(copies, RoundRobin(quantum))) == timeline
+
+        scheduling.round_robin(processes, quantum)
+        out = capsys.readouterr().out
+        assert reference_gantt(timeline) in out
+        assert {p.pid: (p.wt, p.tat) for p in processes} == \
+            {p.pid: (p.wt, p.tat) for p in expected}
+
+# A workload file out of arrival order cannot be streamed; replay() runs it
+# as a table instead, with the same results as run() on the processes
+@pytest.mark.parametrize("name", ["fcfs", "sjf_preemptive", "priority_preemptive"])
+def test_replay_unsorted_file(name, tmp_path):
+    rng = random.Random(5)
+    processes = workload(rng) + [Process("LAST", 0, 3, 1)]
+    path = tmp_path / "w.csv"
+    path.write_text("".join(f"{p.pid},{p.at},{p.bt},{p.priority}\n" for p in processes))
+
+    out = io.StringIO()
+    scheduling.replay(str(path), name, table="csv", table_out=out)
+    rows = {line.split(",")[0]: tuple(map(int, line.split(",")[3:]))
+            for line in out.getvalue().splitlines()[1:]}
+    run(processes, scheduling.make_scheduler(name))
+    assert rows == {p.pid: (p.wt, p.tat) for p in processes}
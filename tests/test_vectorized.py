@@ -0,0 +1,63 @@
+# NumPy FCFS against the event-driven engine, on seeded random workloads with
+# tied arrivals, idle gaps and zero bursts
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from cpusched import FCFS, ProcessTable, run_table, simulate, vectorized
+from cpusched.vectorized import fcfs, run_fcfs_table
+
+def workload(rng):
+    n = rng.randint(1, 40)
+    at = [rng.randint(0, 60) for _ in range(n)]
+    bt = [rng.choice((0, rng.randint(1, 8))) for _ in range(n)]
+    return at, bt
+
+def test_fcfs_matches_engine():
+    rng = random.Random(7)
+    for _ in range(300):
+        at, bt = workload(rng)
+        wt, tat, timeline = simulate(at, bt, [0] * len(at), FCFS(), timeline=[])
+        vwt, vtat, order, start, finish = fcfs(at, bt)
+        assert vwt.tolist() == wt
+        assert vtat.tolist() == tat
+        assert list(zip(order.tolist(), start.tolist(), finish.tolist())) == timeline
+
+        # sorted input takes the path without the argsort
+        order = sorted(range(len(at)), key=at.__getitem__)
+        at, bt = [at[i] for i in order], [bt[i] for i in order]
+        wt, tat, timeline = simulate(at, bt, [0] * len(at), FCFS(), timeline=[])
+        for ordered in (None, True):
+            vwt, vtat, order, start, finish = fcfs(at, bt, ordered)
+            assert (vwt.tolist(), vtat.tolist()) == (wt, tat)
+            assert list(zip(order.tolist(), start.tolist(), finish.tolist())) == timeline
+
+def test_run_table_uses_numpy_for_fcfs(monkeypatch):
+    calls = []
+    monkeypatch.setattr(vectorized, "run_fcfs_table",
+                        lambda table: calls.append(len(table)) or run_fcfs_table(table))
+    rng = random.Random(11)
+    for _ in range(100):
+        at, bt = workload(rng)
+        table = ProcessTable()
+        for a, b in zip(at, bt):
+            table.append(a, b)
+        wt, tat, expected = simulate(at, bt, [0] * len(at), FCFS())
+        timeline = run_table(table, FCFS())
+        assert list(table.wt) == wt
+        assert list(table.tat) == tat
+        assert list(timeline) == [(f"P{i + 1}", s, f) for i, s, f in expected]
+    assert len(calls) == 100
+
+def test_table_averages():
+    rng = random.Random(12)
+    at, bt = workload(rng)
+    table = ProcessTable()
+    for a, b in zip(at, bt):
+        table.append(a, b)
+    run_table(table, FCFS())
+    n = len(table)
+    assert table.averages() == pytest.approx((sum(table.wt) / n, sum(table.tat) / n))
@@ -0,0 +1,67 @@
+# Binary .cpt traces: conversion from CSV, memory-mapped loading, rejection of
+# damaged files and running a mapped table
+
+import random
+
+import pytest
+
+from cpusched import SRTF, ProcessTable, convert, load_table, run_table, save_table, simulate
+from cpusched.workload import map_columns
+
+def write_csv(path, rows):
+    with open(path, "w") as f:
+        f.write("pid,at,bt,priority\n")
+        for i, (at, bt, priority) in enumerate(rows):
+            f.write(f"P{i + 1},{at},{bt},{priority}\n")
+
+def random_rows(rng, n, ordered):
+    at = [rng.randint(0, 1000) for _ in range(n)]
+    if ordered:
+        at.sort()
+    return [(a, rng.randint(1, 50), rng.randint(0, 9)) for a in at]
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_csv_round_trip(tmp_path, ordered):
+    rows = random_rows(random.Random(1), 500, ordered)
+    write_csv(tmp_path / "w.csv", rows)
+    convert(tmp_path / "w.csv", tmp_path / "w.cpt")
+
+    table = load_table(tmp_path / "w.cpt")
+    assert list(zip(table.at, table.bt, table.priority)) == rows
+    assert table.by_arrival == ordered
+    assert map_columns(tmp_path / "w.cpt")[3] == ordered
+
+def test_empty_trace(tmp_path):
+    save_table(tmp_path / "empty.cpt", ProcessTable())
+    assert len(load_table(tmp_path / "empty.cpt")) == 0
+
+def test_damaged_files_are_rejected(tmp_path):
+    table = ProcessTable()
+    for at, bt, priority in random_rows(random.Random(2), 10, True):
+        table.append(at, bt, priority)
+    save_table(tmp_path / "w.cpt", table)
+    data = (tmp_path / "w.cpt").read_bytes()
+
+    damaged = {
+        "truncated.cpt": data[:-8],
+        "header.cpt": data[:16],
+        "magic.cpt": b"XXXX" + data[4:],
+        "version.cpt": data[:4] + b"\x09" + data[5:],
+    }
+    for name, content in damaged.items():
+        (tmp_path / name).write_bytes(content)
+        with pytest.raises(ValueError):
+            load_table(tmp_path / name)
+
+def test_run_table_on_mapped_trace(tmp_path):
+    rows = random_rows(random.Random(3), 300, True)
+    write_csv(tmp_path / "w.csv", rows)
+    convert(tmp_path / "w.csv", tmp_path / "w.cpt")
+    at, bt, priority = (list(column) for column in zip(*rows))
+    wt, tat, expected = simulate(at, bt, priority, SRTF())
+
+    table = load_table(tmp_path / "w.cpt")
+    timeline = run_table(table, SRTF())
+    assert list(table.wt) == wt
+    assert list(table.tat) == tat
+    assert list(timeline) == [(f"P{i + 1}", s, f) for i, s, f in expected]